@@ -1,10 +1,32 @@
 """CLI entry point for pipeline."""
 import argparse
+import os
+import shutil
 import sys
+import tempfile
+import zipfile
 from pathlib import Path
+from typing import Optional
 
-from src.config import Config
-from src.pipeline import Pipeline
+
+def _find_html(root: Path) -> Optional[Path]:
+    """
+    Find the first HTML file under root with a single walk.
+
+    Checks the top level first (the common case for chapter ZIPs)
+    before recursing, and returns on the first hit instead of
+    materializing full glob lists.
+    """
+    for entry in root.iterdir():
+        if entry.is_file() and entry.suffix.lower() in ('.html', '.htm'):
+            return entry
+
+    for dirpath, _, files in os.walk(root):
+        for name in files:
+            if name.lower().endswith(('.html', '.htm')):
+                return Path(dirpath) / name
+
+    return None
 
 
 def main():
@@ -48,6 +70,11 @@ def main():
     if not args.url and not args.html and not args.zip:
         parser.error("Provide a URL, --html, or --zip")
 
+    # Deferred until after arg parsing: importing the pipeline pulls in
+    # heavy dependencies, and --help/usage errors shouldn't pay for them
+    from src.config import Config
+    from src.pipeline import Pipeline
+
     # Load configuration
     try:
         config = Config.load(args.config)
@@ -63,9 +90,6 @@ def main():
     # Handle ZIP extraction
     html_path = None
     if args.zip:
-        import zipfile
-        import tempfile
-
         zip_path = Path(args.zip)
         if not zip_path.exists():
             print(f"Error: ZIP file not found: {zip_path}", file=sys.stderr)
@@ -77,15 +101,32 @@ def main():
 
         print(f"Extracting ZIP: {zip_path}")
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
+            # Stream each entry with a 1 MiB buffer instead of extractall,
+            # which copies in small unbuffered chunks
+            extract_root = temp_dir.resolve()
+            for info in zip_ref.infolist():
+                if info.is_dir():
+                    continue
+                target = temp_dir / info.filename
+                # extractall sanitizes entry names; extracting manually
+                # must too, or a crafted archive with ../ entries could
+                # write outside the temp directory (zip-slip)
+                if not target.resolve().is_relative_to(extract_root):
+                    print(
+                        f"Skipping unsafe ZIP entry: {info.filename}",
+                        file=sys.stderr
+                    )
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with zip_ref.open(info) as src, open(target, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, length=1024 * 1024)
 
         # Find HTML file
-        html_files = list(temp_dir.glob("**/*.html")) + list(temp_dir.glob("**/*.htm"))
-        if not html_files:
+        html_path = _find_html(temp_dir)
+        if html_path is None:
             print("Error: No HTML file found in ZIP", file=sys.stderr)
             sys.exit(1)
 
-        html_path = html_files[0]
         print(f"Found HTML: {html_path}")
 
     elif args.html:
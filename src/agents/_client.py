@@ -0,0 +1,56 @@
+"""Shared Anthropic client for agent modules."""
+import asyncio
+import logging
+from typing import Optional
+
+import httpx
+from anthropic import AsyncAnthropic
+
+from src.config import Config
+
+
+logger = logging.getLogger(__name__)
+
+
+_client: Optional[AsyncAnthropic] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_client(config: Config) -> AsyncAnthropic:
+    """
+    Get the shared AsyncAnthropic client for the running event loop.
+
+    Instantiating a client per stage sets up a fresh httpx connection
+    pool, paying a TLS handshake on the first request each time.
+    Sharing one client keeps connections warm across pipeline stages
+    and chapter pages.
+
+    Each Pipeline.run() executes under a fresh asyncio.run() loop, and
+    a client built on an earlier (now closed) loop holds transports
+    bound to it — reusing it fails every request. The cache is keyed
+    on the running loop and rebuilt when it changes; the stale client
+    is dropped for garbage collection since its loop can no longer
+    close it cleanly.
+
+    Args:
+        config: Configuration (supplies the API key)
+
+    Returns:
+        Shared AsyncAnthropic instance for this loop
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = AsyncAnthropic(
+            api_key=config.anthropic_api_key,
+            max_retries=2,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=16
+                )
+            )
+        )
+        _client_loop = loop
+    return _client
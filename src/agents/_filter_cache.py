@@ -0,0 +1,60 @@
+"""Persistent cache for filter agent classifications."""
+import asyncio
+import hashlib
+import logging
+import shelve
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class FilterCache:
+    """
+    On-disk cache for LLM filter decisions, keyed by text + position.
+
+    Identical strings (repeated SFX, watermarks) appear many times per
+    chapter; caching collapses them to a single API call. The key
+    includes the model name so model upgrades bypass stale entries.
+    Disk access is wrapped in ``asyncio.to_thread`` so it never blocks
+    the event loop.
+    """
+
+    def __init__(self, workspace_dir: Path, model: str):
+        cache_dir = workspace_dir / "filter_cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._path = str(cache_dir / "classifications")
+        self._model = model
+        self._lock = asyncio.Lock()
+
+    def _make_key(self, text: str, position: str) -> str:
+        raw = f"{text}|{position}|{self._model}".encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def _get_sync(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with shelve.open(self._path) as db:
+                return db.get(key)
+        except Exception as e:
+            logger.debug(f"Filter cache read failed: {e}")
+            return None
+
+    def _set_sync(self, key: str, value: Dict[str, Any]):
+        try:
+            with shelve.open(self._path) as db:
+                db[key] = value
+        except Exception as e:
+            logger.debug(f"Filter cache write failed: {e}")
+
+    async def get(self, text: str, position: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached classification, or None on miss."""
+        key = self._make_key(text, position)
+        async with self._lock:
+            return await asyncio.to_thread(self._get_sync, key)
+
+    async def set(self, text: str, position: str, result: Dict[str, Any]):
+        """Store a classification result for later runs."""
+        key = self._make_key(text, position)
+        async with self._lock:
+            await asyncio.to_thread(self._set_sync, key, result)
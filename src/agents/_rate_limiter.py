@@ -0,0 +1,83 @@
+"""Async token-bucket rate limiter for agent API calls."""
+import asyncio
+import time
+from typing import Optional
+
+from src.config import Config
+
+
+class TokenBucket:
+    """
+    Token-bucket limiter enforcing a requests-per-minute budget.
+
+    Unlike a fixed inter-batch sleep, the bucket admits requests at
+    exactly the allowed rate: bursts pass immediately while tokens
+    remain, and callers only wait when the budget is exhausted.
+
+    Usage::
+
+        async with bucket:
+            response = await client.messages.create(...)
+    """
+
+    def __init__(self, max_rate: int, time_period: float = 60.0):
+        """
+        Initialize bucket.
+
+        Args:
+            max_rate: Requests allowed per time_period
+            time_period: Refill window in seconds (default one minute)
+        """
+        self._max_rate = max_rate
+        self._period = time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request slot is available."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self._max_rate),
+                    self._tokens
+                    + (now - self._last_refill) * self._max_rate / self._period
+                )
+                self._last_refill = now
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+
+                # Sleep just long enough for the next token to accrue
+                await asyncio.sleep(
+                    (1.0 - self._tokens) * self._period / self._max_rate
+                )
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+_limiter: Optional[TokenBucket] = None
+_limiter_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_rate_limiter(config: Config) -> TokenBucket:
+    """
+    Get the limiter shared by all agent calls on the running loop.
+
+    The bucket's asyncio.Lock binds to the loop it first runs under,
+    and every Pipeline.run() uses a fresh asyncio.run() loop — so the
+    cache is keyed on the running loop and a new bucket is built when
+    the loop changes.
+    """
+    global _limiter, _limiter_loop
+    loop = asyncio.get_running_loop()
+    if _limiter is None or _limiter_loop is not loop:
+        _limiter = TokenBucket(config.agents.rpm)
+        _limiter_loop = loop
+    return _limiter
@@ -0,0 +1,63 @@
+"""Persistent cache for translation results."""
+import asyncio
+import hashlib
+import logging
+import shelve
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationCache:
+    """
+    On-disk cache for translations, keyed by normalized Korean text.
+
+    Manhwa dialogue repeats heavily (onomatopoeia, names, short
+    replies), so identical strings within and across chapters need only
+    one API call. Text is NFC-normalized and stripped before hashing;
+    the key includes the model name so model upgrades bypass stale
+    entries. Disk access is wrapped in ``asyncio.to_thread`` so it
+    never blocks the event loop.
+    """
+
+    def __init__(self, workspace_dir: Path, model: str):
+        cache_dir = workspace_dir / "translation_cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._path = str(cache_dir / "translations")
+        self._model = model
+        self._lock = asyncio.Lock()
+
+    def _make_key(self, text: str) -> str:
+        normalized = unicodedata.normalize('NFC', text).strip()
+        raw = f"{normalized}|{self._model}".encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def _get_sync(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with shelve.open(self._path) as db:
+                return db.get(key)
+        except Exception as e:
+            logger.debug(f"Translation cache read failed: {e}")
+            return None
+
+    def _set_sync(self, key: str, value: Dict[str, Any]):
+        try:
+            with shelve.open(self._path) as db:
+                db[key] = value
+        except Exception as e:
+            logger.debug(f"Translation cache write failed: {e}")
+
+    async def get(self, text: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached translation, or None on miss."""
+        key = self._make_key(text)
+        async with self._lock:
+            return await asyncio.to_thread(self._get_sync, key)
+
+    async def set(self, text: str, result: Dict[str, Any]):
+        """Store a translation result for later runs."""
+        key = self._make_key(text)
+        async with self._lock:
+            await asyncio.to_thread(self._set_sync, key, result)
@@ -2,16 +2,101 @@
 import asyncio
 import json
 import logging
-from typing import List, Dict, Any
+import re
+from collections import defaultdict
+from typing import List, Dict, Any, Optional
 
+import numpy as np
 from anthropic import AsyncAnthropic
 
+try:
+    import orjson
+except ImportError:  # optional C-accelerated serializer
+    orjson = None
+
 from src.config import Config
+from src.agents._client import get_client
+from src.agents._filter_cache import FilterCache
+from src.agents._rate_limiter import get_rate_limiter
 
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize to a JSON string, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Deterministic pre-filter patterns (compiled once at import).
+# Boxes matching these never need an API round-trip.
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+_EMPTY_RE = re.compile(r'^\s*$')
+_JAMO_RE = re.compile(r'^[ㄱ-ㅎㅏ-ㅣ\s!?.,~]+$')
+_WATERMARK_RE = re.compile(
+    r'(NEWTOKI|\.COM|©|웹툰왕국|뉴토끼|다음\s*화)', re.I
+)
+
+
+_POSITION_LABELS = np.array(["top", "middle", "bottom"])
+
+
+def _assign_positions(
+    boxes: List[Dict[str, Any]],
+    image_height: int
+) -> List[str]:
+    """
+    Compute top/middle/bottom position labels for all boxes in one
+    vectorized pass instead of a branchy per-box loop.
+    """
+    if not boxes:
+        return []
+
+    ys = np.fromiter(
+        (b['y'] for b in boxes), dtype=np.float32, count=len(boxes)
+    ) / image_height
+    idx = np.where(ys < 0.2, 0, np.where(ys > 0.8, 2, 1))
+    return _POSITION_LABELS[idx].tolist()
+
+
+def _fast_classify(box: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Classify trivially-decidable boxes without an LLM call.
+
+    Catches empty strings, pure jamo repeats (ㅋㅋㅋㅋ-style SFX) and
+    known watermark/site-UI strings. Returns the box tagged with a
+    filter decision, or None if the box needs the LLM.
+    """
+    text = box.get('text', '')
+
+    if _EMPTY_RE.match(text):
+        category = "noise"
+    elif _WATERMARK_RE.search(text):
+        category = "watermark"
+    elif _JAMO_RE.match(text):
+        category = "sfx"
+    else:
+        return None
+
+    box.update({
+        "filter_decision": "DROP",
+        "filter_category": category,
+        "filter_confidence": 1.0,
+        "filter_reasoning": "Matched deterministic pre-filter"
+    })
+    return box
+
+
 FILTER_AGENT_PROMPT = """You are a semantic text classifier for Korean manhwa (webcomics).
 
 Your task: Classify OCR-extracted text as KEEP (essential dialogue/narration) or DROP (garbage).
@@ -57,11 +142,58 @@ Output (JSON only):
 """
 
 
+# System prompt marked for Anthropic's ephemeral prompt cache: the
+# server reuses the prompt's KV state across requests instead of
+# reprocessing (and billing) the same ~1 KB prefix per call. Built once
+# at import so no per-call list/dict reconstruction of the constant
+# prompt happens either.
+_SYSTEM_CACHED = [
+    {
+        "type": "text",
+        "text": FILTER_AGENT_PROMPT,
+        "cache_control": {"type": "ephemeral"}
+    }
+]
+
+
+def _parse_classification(response_text: str) -> Dict[str, Any]:
+    """
+    Parse a classification JSON payload from a model response.
+
+    Falls back to a conservative KEEP when the response is unparseable.
+    """
+    try:
+        return _loads(response_text)
+    except ValueError:
+        json_match = _JSON_BLOCK_RE.search(response_text)
+        if json_match:
+            return _loads(json_match.group(1))
+
+        logger.warning(f"Failed to parse filter response: {response_text}")
+        return {
+            "decision": "KEEP",
+            "category": "dialogue",
+            "confidence": 0.5,
+            "reasoning": "Failed to parse response, keeping conservatively"
+        }
+
+
+def _build_user_message(box: Dict[str, Any], position: str) -> str:
+    """Serialize one box into the filter prompt's input payload."""
+    return _dumps({
+        "text": box['text'],
+        "box_width": box['w'],
+        "box_height": box['h'],
+        "position": position
+    })
+
+
 async def classify_single_box(
     client: AsyncAnthropic,
     box: Dict[str, Any],
     config: Config,
-    image_height: int
+    position: str,
+    cache: Optional[FilterCache] = None
 ) -> Dict[str, Any]:
     """
     Classify single OCR box with LLM.
@@ -70,85 +202,209 @@ async def classify_single_box(
         client: Anthropic client
         box: OCR box dictionary
         config: Configuration
-        image_height: Total image height for position calculation
+        position: Vertical position label ("top"/"middle"/"bottom")
+        cache: Optional persistent classification cache
 
     Returns:
         Classification result
     """
-    # Determine position
-    y_ratio = box['y'] / image_height
-    if y_ratio < 0.2:
-        position = "top"
-    elif y_ratio > 0.8:
-        position = "bottom"
-    else:
-        position = "middle"
+    # Check cache: identical text at the same position classifies identically
+    if cache is not None:
+        cached = await cache.get(box['text'], position)
+        if cached is not None:
+            box.update(cached)
+            return box
 
     # Build prompt
-    user_message = json.dumps({
-        "text": box['text'],
-        "box_width": box['w'],
-        "box_height": box['h'],
-        "position": position
-    }, ensure_ascii=False)
+    user_message = _build_user_message(box, position)
 
     try:
-        response = await client.messages.create(
-            model=config.llm.model,
-            max_tokens=config.llm.max_tokens,
-            temperature=config.llm.temperature,
-            system=FILTER_AGENT_PROMPT,
-            messages=[
-                {"role": "user", "content": user_message}
-            ]
-        )
-
-        # Parse response
-        response_text = response.content[0].text
-
-        # Extract JSON from response
-        try:
-            # Try to parse as JSON
-            result = json.loads(response_text)
-        except json.JSONDecodeError:
-            # Try to extract JSON from markdown code block
-            import re
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group(1))
-            else:
-                logger.warning(f"Failed to parse filter response: {response_text}")
-                # Conservative fallback: KEEP
-                result = {
-                    "decision": "KEEP",
-                    "category": "dialogue",
-                    "confidence": 0.5,
-                    "reasoning": "Failed to parse response, keeping conservatively"
-                }
-
-        return {
-            **box,
+        # Token bucket admits requests at exactly the allowed RPM
+        async with get_rate_limiter(config):
+            # Stream the response and stop as soon as the JSON payload
+            # is complete, overlapping parse with the remaining receive
+            buffer = ""
+            result = None
+            async with client.messages.stream(
+                model=config.llm.model,
+                max_tokens=config.llm.max_tokens,
+                temperature=config.llm.temperature,
+                system=_SYSTEM_CACHED,
+                messages=[
+                    {"role": "user", "content": user_message}
+                ]
+            ) as stream:
+                async for chunk in stream.text_stream:
+                    buffer += chunk
+                    if chunk.rstrip().endswith('}'):
+                        try:
+                            result = _loads(buffer)
+                            break
+                        except ValueError:
+                            continue
+
+        if result is None:
+            result = _parse_classification(buffer)
+
+        classification = {
             "filter_decision": result["decision"],
             "filter_category": result["category"],
             "filter_confidence": result["confidence"],
             "filter_reasoning": result.get("reasoning", "")
         }
 
+        if cache is not None:
+            await cache.set(box['text'], position, classification)
+
+        box.update(classification)
+        return box
+
     except Exception as e:
         logger.error(f"Filter agent failed for box: {e}")
         # Conservative fallback
-        return {
-            **box,
+        box.update({
             "filter_decision": "KEEP",
             "filter_category": "dialogue",
             "filter_confidence": 0.5,
             "filter_reasoning": f"Error: {str(e)}"
-        }
+        })
+        return box
+
+
+async def _classify_via_batch_api(
+    client: AsyncAnthropic,
+    boxes: List[Dict[str, Any]],
+    positions: List[str],
+    config: Config,
+    cache: Optional[FilterCache] = None
+) -> List[Dict[str, Any]]:
+    """
+    Classify boxes through Anthropic's Message Batches API.
+
+    One submission covers the whole chapter, which is cheaper and has
+    higher effective throughput than per-box requests. Used when the
+    stage is throughput-bound rather than latency-bound.
+
+    Args:
+        client: Anthropic client
+        boxes: OCR boxes needing classification
+        positions: Position label per box (same order)
+        config: Configuration
+        cache: Optional persistent classification cache
+
+    Returns:
+        Classified boxes in input order
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(boxes)
+
+    # Resolve cache hits first; only misses go into the submission
+    miss_indices: List[int] = []
+    for idx, (box, position) in enumerate(zip(boxes, positions)):
+        if cache is not None:
+            cached = await cache.get(box['text'], position)
+            if cached is not None:
+                box.update(cached)
+                results[idx] = box
+                continue
+        miss_indices.append(idx)
+
+    if miss_indices:
+        requests = [
+            {
+                "custom_id": f"box-{idx}",
+                "params": {
+                    "model": config.llm.model,
+                    "max_tokens": config.llm.max_tokens,
+                    "temperature": config.llm.temperature,
+                    "system": _SYSTEM_CACHED,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": _build_user_message(
+                                boxes[idx], positions[idx]
+                            )
+                        }
+                    ]
+                }
+            }
+            for idx in miss_indices
+        ]
+
+        batch = await client.messages.batches.create(requests=requests)
+        logger.info(
+            f"Submitted message batch {batch.id} with {len(requests)} requests"
+        )
+
+        # Poll with exponential backoff until processing ends
+        delay = 2.0
+        while batch.processing_status != "ended":
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+            batch = await client.messages.batches.retrieve(batch.id)
+
+        async for entry in await client.messages.batches.results(batch.id):
+            idx = int(entry.custom_id.split('-', 1)[1])
+            box = boxes[idx]
+
+            if entry.result.type == "succeeded":
+                # Per-entry guard: one malformed model response must
+                # not unwind the whole stage — mirror the live path's
+                # per-box KEEP fallback
+                try:
+                    result = _parse_classification(
+                        entry.result.message.content[0].text
+                    )
+                    classification = {
+                        "filter_decision": result["decision"],
+                        "filter_category": result["category"],
+                        "filter_confidence": result["confidence"],
+                        "filter_reasoning": result.get("reasoning", "")
+                    }
+                    if cache is not None:
+                        await cache.set(
+                            box['text'], positions[idx], classification
+                        )
+                except Exception as e:
+                    logger.error(f"Failed to parse batch result for box: {e}")
+                    classification = {
+                        "filter_decision": "KEEP",
+                        "filter_category": "dialogue",
+                        "filter_confidence": 0.5,
+                        "filter_reasoning": f"Parse error: {e}"
+                    }
+            else:
+                logger.error(
+                    f"Batch request failed for box: {entry.result.type}"
+                )
+                # Conservative fallback
+                classification = {
+                    "filter_decision": "KEEP",
+                    "filter_category": "dialogue",
+                    "filter_confidence": 0.5,
+                    "filter_reasoning": f"Batch error: {entry.result.type}"
+                }
+
+            box.update(classification)
+            results[idx] = box
+
+    # Any request missing from the results stream falls back to KEEP
+    for idx, result in enumerate(results):
+        if result is None:
+            boxes[idx].update({
+                "filter_decision": "KEEP",
+                "filter_category": "dialogue",
+                "filter_confidence": 0.5,
+                "filter_reasoning": "Missing from batch results"
+            })
+            results[idx] = boxes[idx]
+
+    return results
 
 
 async def filter_text_boxes(
     ocr_boxes: List[Dict[str, Any]],
-    config: Config
+    config: Config,
+    image_height: Optional[float] = None
 ) -> List[Dict[str, Any]]:
     """
     Filter OCR boxes using LLM agent.
@@ -156,59 +412,124 @@ async def filter_text_boxes(
     Args:
         ocr_boxes: List of OCR boxes
         config: Configuration
+        image_height: Known image height; when omitted it is derived
+            from the boxes in one vectorized pass
 
     Returns:
         Filtered list (only KEEP boxes)
+
+    Note:
+        Decision fields are written onto the input box dicts in place;
+        no copies are made.
     """
     if not ocr_boxes:
         return []
 
     logger.info(f"Filtering {len(ocr_boxes)} OCR boxes with LLM...")
 
-    # Initialize Anthropic client
-    client = AsyncAnthropic(api_key=config.anthropic_api_key)
-
-    # Calculate image height (approximate from boxes)
-    image_height = max(box['y'] + box['h'] for box in ocr_boxes) if ocr_boxes else 1000
+    # Shared Anthropic client (keeps connections warm across stages)
+    client = get_client(config)
 
-    # Batch classify (with rate limiting)
-    classified_boxes = []
-    batch_size = 5  # Process 5 at a time to avoid rate limits
+    # Persistent cache collapses duplicate texts (SFX, watermarks) to one call
+    cache = FilterCache(config.workspace_dir, config.llm.model)
 
-    for i in range(0, len(ocr_boxes), batch_size):
-        batch = ocr_boxes[i:i + batch_size]
+    # Calculate image height (approximate from boxes) unless the caller
+    # already knows it from image metadata
+    if image_height is None:
+        extents = np.fromiter(
+            (box['y'] + box['h'] for box in ocr_boxes),
+            dtype=np.float32,
+            count=len(ocr_boxes)
+        )
+        image_height = float(extents.max())
+
+    # Deterministic pre-filter: decide trivial boxes without API calls
+    classified_boxes: List[Optional[Dict[str, Any]]] = [None] * len(ocr_boxes)
+    unknown: List[Dict[str, Any]] = []
+    unknown_indices: List[int] = []
+
+    for idx, box in enumerate(ocr_boxes):
+        decided = _fast_classify(box)
+        if decided is not None:
+            classified_boxes[idx] = decided
+        else:
+            unknown.append(box)
+            unknown_indices.append(idx)
+
+    if len(unknown) < len(ocr_boxes):
+        logger.info(
+            f"Pre-filter decided {len(ocr_boxes) - len(unknown)}/{len(ocr_boxes)} "
+            f"boxes without LLM calls"
+        )
 
-        tasks = [
-            classify_single_box(client, box, config, image_height)
-            for box in batch
-        ]
+    # Classify remaining boxes concurrently, bounded by a semaphore.
+    # The API is network-bound, so overlapping requests (up to the
+    # concurrency cap) beats serial batches with forced sleeps.
+    # One vectorized pass replaces per-box position branching
+    positions = _assign_positions(unknown, image_height)
+
+    # Deduplicate identical (text, position) pairs: repeated SFX and
+    # watermarks need only one LLM decision per chapter
+    groups: Dict[Any, List[int]] = defaultdict(list)
+    for i, (box, pos) in enumerate(zip(unknown, positions)):
+        groups[(box['text'], pos)].append(i)
+
+    rep_boxes = [unknown[idxs[0]] for idxs in groups.values()]
+    rep_positions = [positions[idxs[0]] for idxs in groups.values()]
+
+    if len(rep_boxes) < len(unknown):
+        logger.info(
+            f"Deduplicated {len(unknown)} boxes into "
+            f"{len(rep_boxes)} unique texts"
+        )
 
-        batch_results = await asyncio.gather(*tasks)
-        classified_boxes.extend(batch_results)
+    if (config.agents.use_message_batches
+            and len(rep_boxes) >= config.agents.batch_api_threshold):
+        # Large chapters: one batch submission beats many live requests
+        rep_results = await _classify_via_batch_api(
+            client, rep_boxes, rep_positions, config, cache=cache
+        )
+    else:
+        semaphore = asyncio.Semaphore(config.agents.max_concurrency)
+
+        async def _classify_bounded(
+            box: Dict[str, Any], position: str
+        ) -> Dict[str, Any]:
+            async with semaphore:
+                return await classify_single_box(
+                    client, box, config, position, cache=cache
+                )
+
+        rep_results = await asyncio.gather(
+            *[_classify_bounded(box, pos)
+              for box, pos in zip(rep_boxes, rep_positions)]
+        )
 
-        # Small delay between batches
-        if i + batch_size < len(ocr_boxes):
-            await asyncio.sleep(1)
+    # Scatter each representative's decision to all its duplicates
+    for idxs, rep_result in zip(groups.values(), rep_results):
+        decision_fields = {
+            k: v for k, v in rep_result.items() if k.startswith("filter_")
+        }
+        for i in idxs:
+            unknown[i].update(decision_fields)
+            classified_boxes[unknown_indices[i]] = unknown[i]
 
-    # Filter KEEP only
-    kept_boxes = [
-        box for box in classified_boxes
-        if box.get("filter_decision") == "KEEP"
-    ]
+    # Partition KEEP/DROP in a single pass
+    kept_boxes: List[Dict[str, Any]] = []
+    dropped_boxes: List[Dict[str, Any]] = []
+    for box in classified_boxes:
+        (kept_boxes if box.get("filter_decision") == "KEEP"
+         else dropped_boxes).append(box)
 
     logger.info(f"Kept {len(kept_boxes)}/{len(ocr_boxes)} boxes after filtering")
 
-    # Log dropped boxes
-    dropped_boxes = [
-        box for box in classified_boxes
-        if box.get("filter_decision") == "DROP"
-    ]
-
-    for box in dropped_boxes:
-        logger.debug(
-            f"Dropped: '{box['text']}' - "
-            f"{box.get('filter_category')} "
-            f"({box.get('filter_confidence', 0):.2f})"
-        )
+    # Log dropped boxes (skip f-string formatting entirely unless DEBUG)
+    if logger.isEnabledFor(logging.DEBUG):
+        for box in dropped_boxes:
+            logger.debug(
+                f"Dropped: '{box['text']}' - "
+                f"{box.get('filter_category')} "
+                f"({box.get('filter_confidence', 0):.2f})"
+            )
 
     return kept_boxes
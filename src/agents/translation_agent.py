@@ -2,16 +2,42 @@
 import asyncio
 import json
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 
-from anthropic import AsyncAnthropic
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+
+try:
+    import orjson
+except ImportError:  # optional C-accelerated serializer
+    orjson = None
 
 from src.config import Config
+from src.agents._rate_limiter import get_rate_limiter
+from src.agents._translation_cache import TranslationCache
 
 
 logger = logging.getLogger(__name__)
 
 
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to a JSON string, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 TRANSLATION_AGENT_PROMPT = """You are a Korean→English manhwa translator.
 
 Your task: Translate Korean dialogue preserving tone, context, and character voice.
@@ -47,82 +73,141 @@ Output (JSON only):
 """
 
 
+# System prompt marked for Anthropic's ephemeral prompt cache: the
+# first call warms the cache, every later call in the chapter skips
+# prefill of the static prefix. Built once at module scope.
+_SYSTEM_CACHED = [
+    {
+        "type": "text",
+        "text": TRANSLATION_AGENT_PROMPT,
+        "cache_control": {"type": "ephemeral"}
+    }
+]
+
+
+def _build_user_message(
+    box_idx: int,
+    context_boxes: List[Dict[str, Any]],
+    window_size: int
+) -> str:
+    """Serialize one box plus its ±N context window into the prompt payload."""
+    box = context_boxes[box_idx]
+
+    # Slices clamp out-of-range bounds automatically
+    context_before = [
+        b['text']
+        for b in context_boxes[max(0, box_idx - window_size):box_idx]
+    ]
+    context_after = [
+        b['text']
+        for b in context_boxes[box_idx + 1:box_idx + 1 + window_size]
+    ]
+
+    return _dumps({
+        "original": box['text'],
+        "context_before": context_before,
+        "context_after": context_after
+    })
+
+
+def _parse_translation(response_text: str, original_text: str) -> Dict[str, Any]:
+    """
+    Parse a translation JSON payload from a model response.
+
+    Falls back to the original text when the response is unparseable.
+    """
+    try:
+        return _loads(response_text)
+    except ValueError:
+        # Try to extract from code block
+        json_match = _JSON_BLOCK_RE.search(response_text)
+        if json_match:
+            return _loads(json_match.group(1))
+
+        logger.warning(f"Failed to parse translation response: {response_text}")
+        return {
+            "translated": original_text,
+            "tone": "unknown",
+            "notes": "Failed to parse response"
+        }
+
+
 async def translate_single_box(
-    client: AsyncAnthropic,
-    box: Dict[str, Any],
+    client: "AsyncAnthropic",
+    box_idx: int,
     context_boxes: List[Dict[str, Any]],
-    config: Config
+    config: Config,
+    cache: Optional[TranslationCache] = None
 ) -> Dict[str, Any]:
     """
     Translate single OCR box with context.
 
     Args:
         client: Anthropic client
-        box: OCR box to translate
+        box_idx: Index of the box to translate within context_boxes
         context_boxes: All boxes for context
         config: Configuration
+        cache: Optional persistent translation cache
 
     Returns:
         Box with translation added
     """
-    # Find context boxes (±N boxes around current)
-    box_idx = context_boxes.index(box)
-    window_size = config.translation.context_window_size
+    box = context_boxes[box_idx]
 
-    context_before = []
-    for i in range(max(0, box_idx - window_size), box_idx):
-        context_before.append(context_boxes[i]['text'])
+    # Check cache: repeated SFX and short replies translate identically
+    if cache is not None:
+        cached = await cache.get(box['text'])
+        if cached is not None:
+            return {**box, **cached}
 
-    context_after = []
-    for i in range(box_idx + 1, min(len(context_boxes), box_idx + window_size + 1)):
-        context_after.append(context_boxes[i]['text'])
+    # Hoist Pydantic attribute walks out of the call body
+    llm = config.llm
 
     # Build prompt
-    user_message = json.dumps({
-        "original": box['text'],
-        "context_before": context_before,
-        "context_after": context_after
-    }, ensure_ascii=False)
+    user_message = _build_user_message(
+        box_idx, context_boxes, config.translation.context_window_size
+    )
 
     try:
-        response = await client.messages.create(
-            model=config.llm.model,
-            max_tokens=config.llm.max_tokens,
-            temperature=config.llm.temperature,
-            system=TRANSLATION_AGENT_PROMPT,
-            messages=[
-                {"role": "user", "content": user_message}
-            ]
-        )
-
-        # Parse response
-        response_text = response.content[0].text
-
-        # Extract JSON
-        try:
-            result = json.loads(response_text)
-        except json.JSONDecodeError:
-            # Try to extract from code block
-            import re
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group(1))
-            else:
-                logger.warning(f"Failed to parse translation response: {response_text}")
-                # Fallback: use original text
-                result = {
-                    "translated": box['text'],
-                    "tone": "unknown",
-                    "notes": "Failed to parse response"
-                }
-
-        return {
-            **box,
+        # Token bucket admits requests at exactly the allowed RPM
+        async with get_rate_limiter(config):
+            # Stream the response and stop as soon as the JSON payload
+            # is complete; chunks accumulate in a list to avoid O(n^2)
+            # string concatenation
+            chunks: List[str] = []
+            result = None
+            async with client.messages.stream(
+                model=llm.model,
+                max_tokens=llm.max_tokens,
+                temperature=llm.temperature,
+                system=_SYSTEM_CACHED,
+                messages=[
+                    {"role": "user", "content": user_message}
+                ]
+            ) as stream:
+                async for chunk in stream.text_stream:
+                    chunks.append(chunk)
+                    if chunk.rstrip().endswith('}'):
+                        try:
+                            result = _loads(''.join(chunks))
+                            break
+                        except ValueError:
+                            continue
+
+        if result is None:
+            result = _parse_translation(''.join(chunks), box['text'])
+
+        translation = {
             "translated": result["translated"],
             "tone": result.get("tone", "unknown"),
             "translation_notes": result.get("notes", "")
         }
 
+        if cache is not None:
+            await cache.set(box['text'], translation)
+
+        return {**box, **translation}
+
     except Exception as e:
         logger.error(f"Translation failed for box: {e}")
         return {
@@ -133,6 +218,132 @@ async def translate_single_box(
         }
 
 
+async def _translate_via_batch_api(
+    client: "AsyncAnthropic",
+    boxes: List[Dict[str, Any]],
+    config: Config,
+    cache: Optional[TranslationCache] = None
+) -> List[Dict[str, Any]]:
+    """
+    Translate boxes through Anthropic's Message Batches API.
+
+    One submission covers the whole chapter at batch pricing, which
+    beats many live requests when the stage is throughput-bound rather
+    than latency-bound.
+
+    Args:
+        client: Anthropic client
+        boxes: Filtered OCR boxes to translate
+        config: Configuration
+        cache: Optional persistent translation cache
+
+    Returns:
+        Translated boxes in input order
+    """
+    window_size = config.translation.context_window_size
+    llm = config.llm
+    results: List[Optional[Dict[str, Any]]] = [None] * len(boxes)
+
+    # Resolve cache hits first; only misses go into the submission
+    miss_indices: List[int] = []
+    for idx, box in enumerate(boxes):
+        if cache is not None:
+            cached = await cache.get(box['text'])
+            if cached is not None:
+                results[idx] = {**box, **cached}
+                continue
+        miss_indices.append(idx)
+
+    if miss_indices:
+        requests = [
+            {
+                "custom_id": f"box-{idx}",
+                "params": {
+                    "model": llm.model,
+                    "max_tokens": llm.max_tokens,
+                    "temperature": llm.temperature,
+                    "system": _SYSTEM_CACHED,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": _build_user_message(
+                                idx, boxes, window_size
+                            )
+                        }
+                    ]
+                }
+            }
+            for idx in miss_indices
+        ]
+
+        batch = await client.messages.batches.create(requests=requests)
+        logger.info(
+            f"Submitted message batch {batch.id} with {len(requests)} requests"
+        )
+
+        # Poll with exponential backoff until processing ends
+        delay = 2.0
+        while batch.processing_status != "ended":
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+            batch = await client.messages.batches.retrieve(batch.id)
+
+        async for entry in await client.messages.batches.results(batch.id):
+            idx = int(entry.custom_id.split('-', 1)[1])
+            box = boxes[idx]
+
+            if entry.result.type == "succeeded":
+                # Per-entry guard: a malformed model response leaves
+                # the slot unset so the partial retry below handles it,
+                # instead of a KeyError unwinding the whole stage
+                try:
+                    result = _parse_translation(
+                        entry.result.message.content[0].text, box['text']
+                    )
+                    translation = {
+                        "translated": result["translated"],
+                        "tone": result.get("tone", "unknown"),
+                        "translation_notes": result.get("notes", "")
+                    }
+                    if cache is not None:
+                        await cache.set(box['text'], translation)
+                except Exception as e:
+                    logger.error(f"Failed to parse batch result for box: {e}")
+                    continue
+            else:
+                # Leave unset so the partial retry below picks it up
+                logger.error(
+                    f"Batch request failed for box: {entry.result.type}"
+                )
+                continue
+
+            results[idx] = {**box, **translation}
+
+    # Retry only the failed/missing boxes with live calls instead of
+    # falling back to the original text for all of them
+    missing = [idx for idx, result in enumerate(results) if result is None]
+    if missing:
+        logger.warning(f"Retrying {len(missing)} boxes that failed in batch")
+        retried = await asyncio.gather(
+            *[translate_single_box(client, idx, boxes, config, cache=cache)
+              for idx in missing],
+            return_exceptions=True
+        )
+        for idx, result in zip(missing, retried):
+            if isinstance(result, Exception):
+                logger.error(f"Retry failed for box: {result}")
+                results[idx] = {
+                    **boxes[idx],
+                    "translated": boxes[idx]['text'],  # Fallback to original
+                    "tone": "unknown",
+                    "translation_notes": f"Retry failed: {result}"
+                }
+            else:
+                results[idx] = result
+
+    return results
+
+
 async def translate_text_boxes(
     filtered_boxes: List[Dict[str, Any]],
     config: Config
@@ -152,35 +363,54 @@ async def translate_text_boxes(
 
     logger.info(f"Translating {len(filtered_boxes)} text boxes...")
 
-    # Initialize Anthropic client
+    # Initialize Anthropic client (imported on first use so merely
+    # importing this module stays cheap)
+    from anthropic import AsyncAnthropic
     client = AsyncAnthropic(api_key=config.anthropic_api_key)
 
-    # Translate with batching
-    translated_boxes = []
-    batch_size = 5
-
-    for i in range(0, len(filtered_boxes), batch_size):
-        batch = filtered_boxes[i:i + batch_size]
-
-        tasks = [
-            translate_single_box(client, box, filtered_boxes, config)
-            for box in batch
-        ]
-
-        batch_results = await asyncio.gather(*tasks)
-        translated_boxes.extend(batch_results)
+    # Persistent cache collapses repeated texts to one call
+    cache = TranslationCache(config.workspace_dir, config.llm.model)
 
-        # Small delay between batches
-        if i + batch_size < len(filtered_boxes):
-            await asyncio.sleep(1)
+    if (config.agents.use_message_batches
+            and len(filtered_boxes) >= config.agents.batch_api_threshold):
+        # Large chapters: one batch submission at batch pricing
+        translated_boxes = await _translate_via_batch_api(
+            client, filtered_boxes, config, cache=cache
+        )
+    else:
+        # Translate concurrently, bounded by a semaphore matching the
+        # provider's concurrent-request allowance
+        semaphore = asyncio.Semaphore(config.agents.max_concurrency)
+
+        async def _translate_bounded(box_idx: int) -> tuple:
+            async with semaphore:
+                result = await translate_single_box(
+                    client, box_idx, filtered_boxes, config, cache=cache
+                )
+                return box_idx, result
+
+        # Consume completions as they land (no head-of-line blocking)
+        # and reassemble input order by index
+        total = len(filtered_boxes)
+        translated_boxes = [None] * total
+        completed = 0
+
+        tasks = [_translate_bounded(i) for i in range(total)]
+        for future in asyncio.as_completed(tasks):
+            idx, result = await future
+            translated_boxes[idx] = result
+            completed += 1
+            if completed % 10 == 0 or completed == total:
+                logger.info(f"Translated {completed}/{total} boxes")
 
     logger.info(f"Translation complete: {len(translated_boxes)} boxes")
 
-    # Log translations
-    for box in translated_boxes:
-        logger.debug(
-            f"'{box['text']}' → '{box.get('translated', '')}' "
-            f"[{box.get('tone', 'unknown')}]"
-        )
+    # Log translations (skip f-string formatting entirely unless DEBUG)
+    if logger.isEnabledFor(logging.DEBUG):
+        for box in translated_boxes:
+            logger.debug(
+                f"'{box['text']}' → '{box.get('translated', '')}' "
+                f"[{box.get('tone', 'unknown')}]"
+            )
 
     return translated_boxes
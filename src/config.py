@@ -2,9 +2,44 @@
 import os
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
+
+
+# C-implemented loader when libyaml is available (same semantics,
+# much faster parse)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# load_dotenv walks the filesystem; do it once per process
+_dotenv_loaded = False
+
+# Parsed YAML cache keyed by path, invalidated on mtime change
+_yaml_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _load_env_once():
+    """Load .env into the environment on first call only."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+def _read_yaml(config_file: Path) -> Dict[str, Any]:
+    """Parse a YAML config file, reusing the cache while mtime is unchanged."""
+    path_key = str(config_file)
+    mtime = config_file.stat().st_mtime
+
+    cached = _yaml_cache.get(path_key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(config_file, 'r') as f:
+        data = yaml.load(f, Loader=_YAML_LOADER) or {}
+
+    _yaml_cache[path_key] = (mtime, data)
+    return data
 
 
 class OCRConfig(BaseModel):
@@ -46,6 +81,24 @@ class LLMConfig(BaseModel):
     max_tokens: int = 1024
 
 
+class AgentsConfig(BaseModel):
+    """LLM agent execution settings."""
+    max_concurrency: int = 8
+    rpm: int = 50
+    use_message_batches: bool = False
+    batch_api_threshold: int = 20
+
+
+class IngesterConfig(BaseModel):
+    """HTML ingestion settings."""
+    fast_regex_parser: bool = False
+
+
+class DownloadConfig(BaseModel):
+    """Panel download settings."""
+    max_concurrency: int = 16
+
+
 class TranslationConfig(BaseModel):
     """Translation settings."""
     target_language: str = "en"
@@ -77,18 +130,26 @@ class Config(BaseModel):
     panel_filter: PanelFilterConfig = Field(default_factory=PanelFilterConfig)
     smart_split: SmartSplitConfig = Field(default_factory=SmartSplitConfig)
     llm: LLMConfig = Field(default_factory=LLMConfig)
+    agents: AgentsConfig = Field(default_factory=AgentsConfig)
+    ingester: IngesterConfig = Field(default_factory=IngesterConfig)
+    download: DownloadConfig = Field(default_factory=DownloadConfig)
     translation: TranslationConfig = Field(default_factory=TranslationConfig)
     storage: StorageConfig = Field(default_factory=StorageConfig)
     fonts: FontConfig = Field(default_factory=FontConfig)
     debug: DebugConfig = Field(default_factory=DebugConfig)
 
-    # API keys
-    anthropic_api_key: Optional[str] = None
+    # API keys. validate_default preserves the v1 always=True
+    # behaviour: a missing key fails at construction, not at the
+    # first API call.
+    anthropic_api_key: Optional[str] = Field(
+        default=None, validate_default=True
+    )
 
     # Paths
     workspace_dir: Path = Path("./workspace")
 
-    @validator("anthropic_api_key", always=True)
+    @field_validator("anthropic_api_key", mode="before")
+    @classmethod
     def validate_api_key(cls, v):
         """Validate Anthropic API key is present."""
         if not v:
@@ -108,22 +169,39 @@ class Config(BaseModel):
         Returns:
             Config instance
         """
-        # Load environment variables from .env
-        load_dotenv()
+        # Load environment variables from .env (first call only)
+        _load_env_once()
 
         # Load YAML configuration
         config_data: Dict[str, Any] = {}
         config_file = Path(config_path)
 
         if config_file.exists():
-            with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f) or {}
+            # Copy so callers can't mutate the cached parse
+            config_data = dict(_read_yaml(config_file))
 
         # Add API key from environment
         config_data["anthropic_api_key"] = os.getenv("ANTHROPIC_API_KEY")
 
         return cls(**config_data)
 
+    @classmethod
+    def load_from_dict(cls, config_data: Dict[str, Any]) -> "Config":
+        """
+        Build configuration from an in-memory dictionary.
+
+        Bypasses YAML and .env entirely; useful for programmatic and
+        test setups.
+
+        Args:
+            config_data: Configuration values (must include
+                anthropic_api_key)
+
+        Returns:
+            Config instance
+        """
+        return cls(**config_data)
+
     def ensure_workspace(self):
         """Create workspace directory structure."""
         subdirs = [
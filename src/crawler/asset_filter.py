@@ -1,7 +1,7 @@
 """Panel extraction heuristics."""
 import logging
-from typing import List
-from urllib.parse import urlparse
+import re
+from typing import List, Optional, Tuple
 
 from src.config import Config
 
@@ -9,6 +9,39 @@ from src.config import Config
 logger = logging.getLogger(__name__)
 
 
+# Lazily-built alternation pattern for keyword exclusion, rebuilt only
+# when the configured keyword list changes
+_exclude_cache: Tuple[tuple, Optional[re.Pattern]] = ((), None)
+
+
+def _is_excluded(url_lower: str, keywords: List[str]) -> bool:
+    """
+    Check URL against excluded keywords in a single linear scan.
+
+    A compiled alternation regex replaces K separate substring searches
+    per URL; the pattern is cached against the keyword tuple.
+    """
+    global _exclude_cache
+    key = tuple(keywords)
+    cached_key, pattern = _exclude_cache
+
+    if key != cached_key:
+        pattern = re.compile('|'.join(map(re.escape, key))) if key else None
+        _exclude_cache = (key, pattern)
+
+    return pattern is not None and pattern.search(url_lower) is not None
+
+
+def _strip_query(url: str) -> str:
+    """
+    Drop query string and fragment for deduplication.
+
+    Plain string splits; urlparse is far heavier and we never need
+    auth/port decoding here.
+    """
+    return url.split('?', 1)[0].split('#', 1)[0]
+
+
 async def extract_panel_urls_from_page(page, config: Config) -> List[str]:
     """
     Extract panel URLs from Playwright page using multi-strategy approach.
@@ -20,8 +53,6 @@ async def extract_panel_urls_from_page(page, config: Config) -> List[str]:
     Returns:
         List of unique panel URLs
     """
-    candidates = []
-
     # Strategy 1: Try common selectors
     selectors = [
         "img.webtoon-panel",
@@ -36,26 +67,40 @@ async def extract_panel_urls_from_page(page, config: Config) -> List[str]:
         "p img",  # newtoki469.com pattern: <p><img></p>
     ]
 
-    for selector in selectors:
-        try:
-            elements = await page.query_selector_all(selector)
-            for elem in elements:
-                url = await elem.get_attribute("src")
-                if not url:
-                    url = await elem.get_attribute("data-src")
+    # Run every selector in-browser in a single CDP round-trip;
+    # getBoundingClientRect executes at native speed and the page
+    # returns one plain JSON list
+    js = """
+    (selectors) => selectors.flatMap(
+        (s) => Array.from(document.querySelectorAll(s)).map((e) => {
+            const r = e.getBoundingClientRect();
+            return {
+                url: e.src || e.dataset.src || null,
+                width: r.width,
+                height: r.height
+            };
+        })
+    )
+    """
 
-                if url:
-                    # Get element dimensions
-                    box = await elem.bounding_box()
-                    if box:
-                        candidates.append({
-                            "url": url,
-                            "width": box["width"],
-                            "height": box["height"]
-                        })
-        except Exception as e:
-            logger.debug(f"Selector {selector} failed: {e}")
+    try:
+        raw_candidates = await page.evaluate(js, selectors)
+    except Exception as e:
+        logger.debug(f"In-page selector evaluation failed: {e}")
+        raw_candidates = []
+
+    # Overlapping selectors match the same <img> repeatedly; drop exact
+    # duplicates here so later stages see each element once
+    seen_candidates = set()
+    candidates = []
+    for c in raw_candidates:
+        if not c["url"]:
+            continue
+        key = (c["url"], int(c["width"]), int(c["height"]))
+        if key in seen_candidates:
             continue
+        seen_candidates.add(key)
+        candidates.append(c)
 
     logger.info(f"Found {len(candidates)} candidate images")
 
@@ -85,7 +130,7 @@ async def extract_panel_urls_from_page(page, config: Config) -> List[str]:
         url_lower = candidate["url"].lower()
 
         # Check if URL contains excluded keywords
-        if any(keyword in url_lower for keyword in excluded_keywords):
+        if _is_excluded(url_lower, excluded_keywords):
             continue
 
         final_candidates.append(candidate["url"])
@@ -98,8 +143,7 @@ async def extract_panel_urls_from_page(page, config: Config) -> List[str]:
 
     for url in final_candidates:
         # Normalize URL (remove query params for deduplication)
-        parsed = urlparse(url)
-        base_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        base_url = _strip_query(url)
 
         if base_url not in seen:
             seen.add(base_url)
@@ -137,6 +181,8 @@ async def extract_panel_urls_selenium(driver, config: Config) -> List[str]:
         (By.CSS_SELECTOR, "p img"),  # newtoki469.com pattern: <p><img></p>
     ]
 
+    seen_candidates = set()
+
     for by, selector in selectors:
         try:
             elements = driver.find_elements(by, selector)
@@ -145,6 +191,10 @@ async def extract_panel_urls_selenium(driver, config: Config) -> List[str]:
 
                 if url:
                     size = elem.size
+                    key = (url, size["width"], size["height"])
+                    if key in seen_candidates:
+                        continue
+                    seen_candidates.add(key)
                     candidates.append({
                         "url": url,
                         "width": size["width"],
@@ -176,7 +226,7 @@ async def extract_panel_urls_selenium(driver, config: Config) -> List[str]:
 
     for candidate in filtered:
         url_lower = candidate["url"].lower()
-        if not any(keyword in url_lower for keyword in excluded_keywords):
+        if not _is_excluded(url_lower, excluded_keywords):
             final_candidates.append(candidate["url"])
 
     # Deduplication
@@ -184,8 +234,7 @@ async def extract_panel_urls_selenium(driver, config: Config) -> List[str]:
     unique_urls = []
 
     for url in final_candidates:
-        parsed = urlparse(url)
-        base_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        base_url = _strip_query(url)
 
         if base_url not in seen:
             seen.add(base_url)
@@ -83,24 +83,34 @@ class PlaywrightDriver(BrowserDriver):
         """Scroll to bottom to load all panels."""
         logger.info("Scrolling to load all panels...")
 
-        prev_height = 0
-        scroll_count = 0
+        max_scrolls = self.config.crawler.max_scrolls
+        pause_ms = int(self.config.crawler.scroll_pause * 1000)
 
-        while scroll_count < self.config.crawler.max_scrolls:
-            # Get current height
-            current_height = await self.page.evaluate("document.body.scrollHeight")
+        prev_height = -1
+        scroll_count = 0
 
-            if current_height == prev_height:
-                logger.info("Reached bottom of page")
+        for _ in range(max_scrolls):
+            height = await self.page.evaluate(
+                "() => { window.scrollTo(0, document.body.scrollHeight);"
+                " return document.body.scrollHeight; }"
+            )
+            if height == prev_height:
                 break
-
-            # Scroll down
-            await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(self.config.crawler.scroll_pause)
-
-            prev_height = current_height
+            prev_height = height
             scroll_count += 1
 
+            # Wait for the page to actually grow rather than sleeping
+            # the full pause; scroll_pause is just the cap. (The load
+            # state latches after navigate(), so waiting on it here
+            # would resolve immediately and skip lazy-loaded panels.)
+            try:
+                await self.page.wait_for_function(
+                    "h => document.body.scrollHeight > h",
+                    arg=height, timeout=pause_ms
+                )
+            except Exception:
+                pass  # no growth within the cap; next pass confirms the end
+
         logger.info(f"Scrolled {scroll_count} times")
 
     async def extract_panel_urls(self) -> List[str]:
@@ -153,22 +163,38 @@ class SeleniumDriver(BrowserDriver):
 
     async def scroll_to_bottom(self):
         """Scroll to bottom."""
-        from selenium.webdriver.common.by import By
-
-        prev_height = 0
-        scroll_count = 0
-
-        while scroll_count < self.config.crawler.max_scrolls:
-            current_height = self.driver.execute_script("return document.body.scrollHeight")
-
-            if current_height == prev_height:
-                break
-
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight)")
-            await asyncio.sleep(self.config.crawler.scroll_pause)
-
-            prev_height = current_height
-            scroll_count += 1
+        max_scrolls = self.config.crawler.max_scrolls
+        pause_ms = int(self.config.crawler.scroll_pause * 1000)
+
+        # Single async script in the page instead of a WebDriver
+        # round-trip per scroll step
+        script = """
+            var maxScrolls = arguments[0];
+            var pause = arguments[1];
+            var done = arguments[arguments.length - 1];
+            var prev = -1;
+            var count = 0;
+            function step() {
+                window.scrollTo(0, document.body.scrollHeight);
+                setTimeout(function () {
+                    var h = document.body.scrollHeight;
+                    if (h === prev || count >= maxScrolls) {
+                        done(count);
+                        return;
+                    }
+                    prev = h;
+                    count += 1;
+                    step();
+                }, pause);
+            }
+            step();
+        """
+
+        # Allow the in-page loop to run to completion plus slack
+        self.driver.set_script_timeout(max_scrolls * (pause_ms / 1000) + 10)
+        scroll_count = self.driver.execute_async_script(
+            script, max_scrolls, pause_ms
+        )
 
         logger.info(f"Scrolled {scroll_count} times")
 
@@ -1,13 +1,66 @@
 """OCR-based captcha solving."""
 import logging
-from pathlib import Path
-from typing import Optional
-import cv2
-import numpy as np
+from typing import Optional, TYPE_CHECKING
+
+# cv2/numpy cost hundreds of ms and tens of MB at import; most runs
+# never hit a captcha, so defer them to the functions that need them
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+# Lazily-initialized PaddleOCR singleton: init loads ~100 MB of weights
+# and takes seconds, dwarfing the actual inference per captcha
+_OCR = None
+
+
+# Comma-joined selector lists: the browser evaluates every alternative
+# in one CDP round-trip instead of one query_selector call each
+_CAPTCHA_SELECTOR = ", ".join([
+    "img.captcha_img",
+    "img.captcha-img",
+    "img[class*='captcha']",
+    ".captcha_box img",
+    "#captcha img",
+    "img[alt*='captcha']",
+])
+
+# Captcha-specific input alternatives batch into one query, but the
+# generic text-input fallback stays a separate second query: in a
+# combined list query_selector returns the first match in DOM order,
+# letting any unrelated text field on the page shadow the captcha input
+_INPUT_SELECTOR = ", ".join([
+    "input[name*='captcha']",
+    "input[id*='captcha']",
+    "input[class*='captcha']",
+])
+
+_INPUT_FALLBACK_SELECTOR = "input[type='text']"
+
+_SUBMIT_SELECTOR = ", ".join([
+    "button[type='submit']",
+    "input[type='submit']",
+    "button:has-text('Submit')",
+    "button:has-text('확인')",  # Korean "OK"
+])
+
+
+def _get_ocr():
+    """Return the shared captcha OCR engine, creating it on first use."""
+    global _OCR
+    if _OCR is None:
+        from paddleocr import PaddleOCR
+
+        _OCR = PaddleOCR(
+            use_angle_cls=False,
+            lang='en',
+            use_gpu=False,
+            show_log=False
+        )
+    return _OCR
+
+
 async def detect_captcha(page) -> Optional[dict]:
     """
     Detect captcha on Playwright page.
@@ -18,27 +71,17 @@ async def detect_captcha(page) -> Optional[dict]:
     Returns:
         Captcha info dict or None if no captcha found
     """
-    # Common captcha selectors
-    selectors = [
-        "img.captcha_img",
-        "img.captcha-img",
-        "img[class*='captcha']",
-        ".captcha_box img",
-        "#captcha img",
-        "img[alt*='captcha']",
-    ]
-
-    for selector in selectors:
-        try:
-            elem = await page.query_selector(selector)
-            if elem:
-                logger.info(f"Captcha detected with selector: {selector}")
-                return {
-                    "element": elem,
-                    "selector": selector
-                }
-        except Exception:
-            continue
+    try:
+        elem = await page.query_selector(_CAPTCHA_SELECTOR)
+    except Exception:
+        return None
+
+    if elem:
+        logger.info("Captcha detected")
+        return {
+            "element": elem,
+            "selector": _CAPTCHA_SELECTOR
+        }
 
     return None
 
@@ -59,15 +102,9 @@ async def solve_captcha(page, captcha_info: dict) -> bool:
         captcha_elem = captcha_info["element"]
         screenshot_bytes = await captcha_elem.screenshot()
 
-        # Save temporarily
-        temp_path = Path("workspace/temp_captcha.png")
-        temp_path.parent.mkdir(exist_ok=True, parents=True)
-
-        with open(temp_path, "wb") as f:
-            f.write(screenshot_bytes)
-
-        # Preprocess image
-        processed = preprocess_captcha(str(temp_path))
+        # Preprocess image straight from the screenshot bytes — no
+        # PNG round-trip through disk
+        processed = preprocess_captcha(screenshot_bytes)
 
         # OCR with PaddleOCR (digits only)
         captcha_text = ocr_captcha(processed)
@@ -78,19 +115,11 @@ async def solve_captcha(page, captcha_info: dict) -> bool:
 
         logger.info(f"Extracted captcha text: {captcha_text}")
 
-        # Find input field and submit button
-        input_selectors = [
-            "input[name*='captcha']",
-            "input[id*='captcha']",
-            "input[class*='captcha']",
-            "input[type='text']",
-        ]
-
-        input_elem = None
-        for selector in input_selectors:
-            input_elem = await page.query_selector(selector)
-            if input_elem:
-                break
+        # Find input field: captcha-specific alternatives first (one
+        # round-trip), generic text input only as a last resort
+        input_elem = await page.query_selector(_INPUT_SELECTOR)
+        if not input_elem:
+            input_elem = await page.query_selector(_INPUT_FALLBACK_SELECTOR)
 
         if not input_elem:
             logger.warning("Could not find captcha input field")
@@ -100,22 +129,14 @@ async def solve_captcha(page, captcha_info: dict) -> bool:
         await input_elem.fill(captcha_text)
 
         # Find and click submit button
-        submit_selectors = [
-            "button[type='submit']",
-            "input[type='submit']",
-            "button:has-text('Submit')",
-            "button:has-text('확인')",  # Korean "OK"
-        ]
-
-        for selector in submit_selectors:
-            try:
-                submit_btn = await page.query_selector(selector)
-                if submit_btn:
-                    await submit_btn.click()
-                    logger.info("Captcha submitted")
-                    return True
-            except Exception:
-                continue
+        try:
+            submit_btn = await page.query_selector(_SUBMIT_SELECTOR)
+            if submit_btn:
+                await submit_btn.click()
+                logger.info("Captcha submitted")
+                return True
+        except Exception:
+            pass
 
         # If no submit button, try pressing Enter
         await input_elem.press("Enter")
@@ -127,18 +148,25 @@ async def solve_captcha(page, captcha_info: dict) -> bool:
         return False
 
 
-def preprocess_captcha(image_path: str) -> np.ndarray:
+def preprocess_captcha(image: "bytes | np.ndarray") -> "np.ndarray":
     """
     Preprocess captcha image for better OCR.
 
     Args:
-        image_path: Path to captcha image
+        image: Encoded image bytes (e.g. a PNG screenshot) or a
+            decoded BGR array
 
     Returns:
         Preprocessed image array
     """
-    # Read image
-    img = cv2.imread(image_path)
+    import cv2
+    import numpy as np
+
+    # Decode in memory when given encoded bytes
+    if isinstance(image, (bytes, bytearray)):
+        img = cv2.imdecode(np.frombuffer(image, np.uint8), cv2.IMREAD_COLOR)
+    else:
+        img = image
 
     # Convert to grayscale
     gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
@@ -146,8 +174,9 @@ def preprocess_captcha(image_path: str) -> np.ndarray:
     # Threshold
     _, binary = cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
 
-    # Denoise
-    denoised = cv2.fastNlMeansDenoising(binary, None, 10, 7, 21)
+    # Denoise: a 3x3 median is plenty for a binarized digit captcha and
+    # orders of magnitude cheaper than non-local means
+    denoised = cv2.medianBlur(binary, 3)
 
     # Morphology operations
     kernel = np.ones((2, 2), np.uint8)
@@ -156,7 +185,7 @@ def preprocess_captcha(image_path: str) -> np.ndarray:
     return morph
 
 
-def ocr_captcha(image: np.ndarray) -> Optional[str]:
+def ocr_captcha(image: "np.ndarray") -> Optional[str]:
     """
     Run OCR on preprocessed captcha image.
 
@@ -167,18 +196,8 @@ def ocr_captcha(image: np.ndarray) -> Optional[str]:
         Extracted text or None
     """
     try:
-        from paddleocr import PaddleOCR
-
-        # Initialize OCR (digits only)
-        ocr = PaddleOCR(
-            use_angle_cls=False,
-            lang='en',
-            use_gpu=False,
-            show_log=False
-        )
-
-        # Run OCR
-        result = ocr.ocr(image, cls=False)
+        # Run OCR (engine is shared across solves)
+        result = _get_ocr().ocr(image, cls=False)
 
         if not result or not result[0]:
             return None
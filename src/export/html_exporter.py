@@ -1,11 +1,35 @@
 """HTML export functionality for translated manhwa."""
 
+import io
+import time
 import zipfile
-import shutil
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
+# Route zipfile's CRC32/DEFLATE through a SIMD-accelerated zlib build
+# when one is installed (isal, then zlib-ng); stock zlib otherwise.
+try:
+    from isal import isal_zlib as _fast_zlib
+except ImportError:
+    try:
+        from zlib_ng import zlib_ng as _fast_zlib
+    except ImportError:
+        _fast_zlib = None
+
+if _fast_zlib is not None:
+    zipfile.zlib = _fast_zlib
+    # zipfile binds crc32 at import time, and CRC is the only CPU work
+    # for the stored image entries — rebind it or the patch is moot
+    zipfile.crc32 = _fast_zlib.crc32
+
+# isal's compressor only accepts levels 0-3 (its scale tops out at
+# ISAL_BEST_COMPRESSION); zlib and zlib-ng go to 9
+_BEST_DEFLATE_LEVEL = (
+    getattr(_fast_zlib, "ISAL_BEST_COMPRESSION", 9)
+    if _fast_zlib is not None else 9
+)
+
 
 def generate_html_viewer(title: str, num_pages: int) -> str:
     """
@@ -183,11 +207,13 @@ def generate_html_viewer(title: str, num_pages: int) -> str:
 
     <div id="viewer">"""
 
-    # Generate image tags for all pages
-    for i in range(num_pages):
-        page_num = i + 1
-        filename = f"page_{i:04d}.png"
-        html_template += f'\n        <img src="img/{filename}" alt="Page {page_num}" loading="lazy" class="loading" data-page="{page_num}">'
+    # Generate image tags for all pages in one join (appending to the
+    # template string N times is quadratic)
+    html_template += "".join(
+        f'\n        <img src="img/page_{i:04d}.png" alt="Page {i + 1}" '
+        f'loading="lazy" class="loading" data-page="{i + 1}">'
+        for i in range(num_pages)
+    )
 
     html_template += """
     </div>
@@ -296,6 +322,58 @@ def generate_html_viewer(title: str, num_pages: int) -> str:
     return html_template
 
 
+def _total_size(final_paths: List[Path]) -> int:
+    """Sum image sizes, failing fast on any missing file."""
+    total = 0
+    for img_path in final_paths:
+        if not img_path.exists():
+            raise IOError(f"Image file not found: {img_path}")
+        total += img_path.stat().st_size
+    return total
+
+
+def _needs_zip64(final_paths: List[Path]) -> bool:
+    """
+    Whether the archive needs ZIP64 extensions.
+
+    ZIP64 writes extra-field headers per entry; typical chapter exports
+    are far below the 2 GB classic-format limit, so skip the overhead
+    unless the payload actually demands it.
+    """
+    return _total_size(final_paths) > 2**31
+
+
+def _write_archive(zipf: zipfile.ZipFile, final_paths: List[Path], html_content: str):
+    """
+    Write the viewer HTML and all page images into an open ZipFile.
+
+    Image bytes are prefetched on a thread pool (file reads release the
+    GIL) so disk I/O overlaps with the single writer's CRC work, while
+    pool.map keeps results in page order.
+    """
+    # Add HTML file (text compresses well, so use the backend's max)
+    zipf.writestr(
+        "index.html", html_content,
+        compress_type=zipfile.ZIP_DEFLATED, compresslevel=_BEST_DEFLATE_LEVEL
+    )
+
+    # Add all images with standardized names. PNGs are already
+    # DEFLATE-compressed, so store them as-is instead of burning
+    # CPU re-compressing for ~0% gain.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        reads = pool.map(Path.read_bytes, final_paths)
+        for i, (path, data) in enumerate(zip(final_paths, reads)):
+            # A bare ZipInfo defaults to mode 000 (unreadable after
+            # extraction on unix tools) and the 1980 ZIP epoch; carry a
+            # sane mode and the source mtime like zipf.write would
+            info = zipfile.ZipInfo(
+                f"img/page_{i:04d}.png",
+                date_time=time.localtime(path.stat().st_mtime)[:6]
+            )
+            info.external_attr = 0o644 << 16
+            zipf.writestr(info, data, compress_type=zipfile.ZIP_STORED)
+
+
 def create_zip_package(final_paths: List[Path], output_path: Path, title: str = "Translated Manhwa") -> Path:
     """
     Create a ZIP package containing translated images and HTML viewer.
@@ -315,44 +393,17 @@ def create_zip_package(final_paths: List[Path], output_path: Path, title: str =
     if not final_paths:
         raise ValueError("No images provided for ZIP package")
 
-    # Create temporary directory for assembly
-    temp_dir = None
-    try:
-        temp_dir = Path(tempfile.mkdtemp(prefix="manhwa_export_"))
-        img_dir = temp_dir / "img"
-        img_dir.mkdir(parents=True, exist_ok=True)
-
-        # Copy images to temp directory with standardized names
-        for i, img_path in enumerate(final_paths):
-            if not img_path.exists():
-                raise IOError(f"Image file not found: {img_path}")
-
-            dest_filename = f"page_{i:04d}.png"
-            dest_path = img_dir / dest_filename
-            shutil.copy2(img_path, dest_path)
+    # Generate HTML viewer
+    html_content = generate_html_viewer(title, len(final_paths))
 
-        # Generate HTML viewer
-        num_pages = len(final_paths)
-        html_content = generate_html_viewer(title, num_pages)
-        html_path = temp_dir / "index.html"
-        html_path.write_text(html_content, encoding="utf-8")
+    # Stream sources straight into the archive; no staging copy
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(
+        output_path, 'w', allowZip64=_needs_zip64(final_paths)
+    ) as zipf:
+        _write_archive(zipf, final_paths, html_content)
 
-        # Create ZIP file
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add HTML file
-            zipf.write(html_path, "index.html")
-
-            # Add all images
-            for img_file in img_dir.iterdir():
-                zipf.write(img_file, f"img/{img_file.name}")
-
-        return output_path
-
-    finally:
-        # Cleanup temporary directory
-        if temp_dir and temp_dir.exists():
-            shutil.rmtree(temp_dir, ignore_errors=True)
+    return output_path
 
 
 def create_zip_package_in_memory(final_paths: List[Path], title: str = "Translated Manhwa") -> bytes:
@@ -374,42 +425,14 @@ def create_zip_package_in_memory(final_paths: List[Path], title: str = "Translat
     if not final_paths:
         raise ValueError("No images provided for ZIP package")
 
-    # Create temporary directory for assembly
-    temp_dir = None
-    try:
-        temp_dir = Path(tempfile.mkdtemp(prefix="manhwa_export_"))
-        img_dir = temp_dir / "img"
-        img_dir.mkdir(parents=True, exist_ok=True)
-
-        # Copy images to temp directory with standardized names
-        for i, img_path in enumerate(final_paths):
-            if not img_path.exists():
-                raise IOError(f"Image file not found: {img_path}")
-
-            dest_filename = f"page_{i:04d}.png"
-            dest_path = img_dir / dest_filename
-            shutil.copy2(img_path, dest_path)
-
-        # Generate HTML viewer
-        num_pages = len(final_paths)
-        html_content = generate_html_viewer(title, num_pages)
-        html_path = temp_dir / "index.html"
-        html_path.write_text(html_content, encoding="utf-8")
-
-        # Create ZIP file in memory
-        zip_path = temp_dir / "manhwa_package.zip"
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Add HTML file
-            zipf.write(html_path, "index.html")
-
-            # Add all images
-            for img_file in img_dir.iterdir():
-                zipf.write(img_file, f"img/{img_file.name}")
-
-        # Read ZIP file into memory
-        return zip_path.read_bytes()
-
-    finally:
-        # Cleanup temporary directory
-        if temp_dir and temp_dir.exists():
-            shutil.rmtree(temp_dir, ignore_errors=True)
+    # Generate HTML viewer
+    html_content = generate_html_viewer(title, len(final_paths))
+
+    # Build the archive in a BytesIO; no temp dir or read-back pass
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(
+        buffer, 'w', allowZip64=_needs_zip64(final_paths)
+    ) as zipf:
+        _write_archive(zipf, final_paths, html_content)
+
+    return buffer.getvalue()
@@ -1,5 +1,6 @@
 """Build inpainting masks from OCR boxes."""
 import logging
+import threading
 from typing import List, Dict, Any
 import numpy as np
 import cv2
@@ -7,6 +8,42 @@ import cv2
 logger = logging.getLogger(__name__)
 
 
+# Pooled int32 vertex buffer, grown by doubling and packed with every
+# polygon of a panel so fillPoly sees views instead of per-box
+# allocations. Thread-local because panels inpaint concurrently.
+_scratch = threading.local()
+
+
+def _vertex_buffer(total_vertices: int) -> np.ndarray:
+    """Return this thread's vertex scratch buffer, grown as needed."""
+    buf = getattr(_scratch, 'buf', None)
+    if buf is None or len(buf) < total_vertices:
+        size = 1024 if buf is None else len(buf)
+        while size < total_vertices:
+            size *= 2
+        buf = np.empty((size, 2), np.int32)
+        _scratch.buf = buf
+    return buf
+
+
+# Separable dilation kernels cached per dilation size: a square
+# structuring element decomposes into a 1xk pass then a kx1 pass with
+# identical binary output at O(k) instead of O(k^2) per pixel
+_DILATE_KERNELS: Dict[int, tuple] = {}
+
+
+def _separable_kernels(dilation: int) -> tuple:
+    """Return cached (1xk, kx1) dilation kernels for a square SE."""
+    kernels = _DILATE_KERNELS.get(dilation)
+    if kernels is None:
+        kernels = (
+            np.ones((1, dilation), np.uint8),
+            np.ones((dilation, 1), np.uint8),
+        )
+        _DILATE_KERNELS[dilation] = kernels
+    return kernels
+
+
 def build_mask_for_panel(
     image_shape: tuple,
     boxes: List[Dict[str, Any]],
@@ -28,40 +65,61 @@ def build_mask_for_panel(
     # Create blank mask
     mask = np.zeros((height, width), dtype=np.uint8)
 
-    # Draw boxes
+    # Partition boxes: polygons batch into one fillPoly call, rectangles
+    # into a coordinate array for vectorized clamping
+    bounds = np.array([width - 1, height - 1], dtype=np.int32)
+    poly_lists = []
+    rects = []
     for box in boxes:
         # Prefer polygon if available (more accurate)
         if 'polygon' in box and box['polygon'] and len(box['polygon']) >= 3:
-            # Use polygon for more accurate mask
-            polygon = box['polygon']
-            pts = np.array(polygon, dtype=np.int32)
-
-            # Ensure coordinates are valid
-            pts[:, 0] = np.clip(pts[:, 0], 0, width - 1)
-            pts[:, 1] = np.clip(pts[:, 1], 0, height - 1)
-
-            # Fill polygon
-            cv2.fillPoly(mask, [pts], 255)
+            poly_lists.append(box['polygon'])
         else:
-            # Fallback to rectangle
-            x = int(box['x'])
-            y = int(box['y'])
-            w = int(box['w'])
-            h = int(box['h'])
-
-            # Ensure coordinates are valid
-            x = max(0, x)
-            y = max(0, y)
-            w = min(w, width - x)
-            h = min(h, height - y)
-
-            # Fill rectangle
-            cv2.rectangle(mask, (x, y), (x + w, y + h), 255, -1)
-
-    # Dilate mask slightly
-    if dilation > 0:
-        kernel = np.ones((dilation, dilation), np.uint8)
-        mask = cv2.dilate(mask, kernel, iterations=1)
+            rects.append((box['x'], box['y'], box['w'], box['h']))
+
+    # Pack all vertices into the pooled buffer, clamp each polygon with
+    # one fused in-place maximum/minimum pair, and fill everything in a
+    # single C-level dispatch
+    if poly_lists:
+        buf = _vertex_buffer(sum(len(p) for p in poly_lists))
+        polygons = []
+        offset = 0
+        for poly in poly_lists:
+            n = len(poly)
+            pts = buf[offset:offset + n]
+            pts[:] = poly
+            np.minimum(np.maximum(pts, 0, out=pts), bounds, out=pts)
+            polygons.append(pts)
+            offset += n
+
+        cv2.fillPoly(mask, polygons, 255)
+
+    if rects:
+        # Clamp all rectangles at once, then fill each via a NumPy
+        # slice assignment (a C memset) instead of a cv2 call per box.
+        # For axis-aligned rectangles a square-kernel dilation is just
+        # padding, so inflate the boxes here instead of running a
+        # full-image morphology pass afterwards — but only when that
+        # pass is actually skipped: with polygons present the whole
+        # mask dilates below, and pre-inflating too would grow the
+        # rectangles by twice the dilation.
+        inflate = 0 if poly_lists else dilation
+        arr = np.array(rects, dtype=np.int32)
+        x0 = np.clip(arr[:, 0] - inflate, 0, width)
+        y0 = np.clip(arr[:, 1] - inflate, 0, height)
+        x1 = np.clip(arr[:, 0] + arr[:, 2] + inflate, 0, width)
+        y1 = np.clip(arr[:, 1] + arr[:, 3] + inflate, 0, height)
+
+        for i in range(len(arr)):
+            mask[y0[i]:y1[i], x0[i]:x1[i]] = 255
+
+    # Arbitrary polygons still need the real dilate; rectangle-only
+    # masks were already drawn inflated above. Two separable 1-D passes
+    # replace the O(k^2) square-kernel dilation.
+    if poly_lists and dilation > 0:
+        horizontal, vertical = _separable_kernels(dilation)
+        mask = cv2.dilate(mask, horizontal, iterations=1)
+        mask = cv2.dilate(mask, vertical, iterations=1)
 
     return mask
 
@@ -1,6 +1,10 @@
 """OpenCV-based inpainting."""
 import asyncio
 import logging
+import os
+import shutil
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 import cv2
@@ -9,10 +13,61 @@ import numpy as np
 from src.config import Config
 from src.inpaint.mask_builder import build_mask_for_panel
 
+try:
+    import pyvips  # threaded PNG encoder, optional
+except ImportError:
+    pyvips = None
+
 
 logger = logging.getLogger(__name__)
 
 
+# Fast PNG settings for cv2.imwrite: level-1 DEFLATE with the RLE
+# strategy, which suits flat manga art far better than the default
+_PNG_PARAMS = [
+    cv2.IMWRITE_PNG_COMPRESSION, 1,
+    cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_RLE,
+]
+
+
+def _write_png(image: np.ndarray, output_path: Path):
+    """Write a PNG via pyvips when installed, else cv2 with fast params."""
+    if pyvips is not None:
+        try:
+            bands = image.shape[2] if image.ndim == 3 else 1
+            # OpenCV arrays are BGR; vips expects RGB order
+            rgb = image[:, :, ::-1] if bands == 3 else image
+            vips_image = pyvips.Image.new_from_memory(
+                np.ascontiguousarray(rgb).data,
+                image.shape[1], image.shape[0], bands, 'uchar'
+            )
+            vips_image.write_to_file(str(output_path), compression=1)
+            return
+        except Exception as e:
+            logger.debug("pyvips write failed, using cv2: %s", e)
+
+    cv2.imwrite(str(output_path), image, _PNG_PARAMS)
+
+
+# cv2.inpaint releases the GIL, so panels parallelize on threads up to
+# core count; inpainting dominates the pipeline's CPU cost
+_INPAINT_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="inpaint"
+)
+
+# Flat-fill fast path: a mask component whose boundary pixels deviate
+# less than this (per channel, in 0-255 levels) is treated as uniform
+# background and filled with the boundary median instead of Telea
+_FLAT_STD_THRESHOLD = 12.0
+
+_BOUNDARY_KERNEL = np.ones((3, 3), np.uint8)
+
+# Above this pixel count, run the diffusion inpaint at half resolution
+# and composite back — cv2.inpaint scales with H*W and full-res
+# webtoon strips take minutes otherwise
+_DOWNSCALE_THRESHOLD_PX = 4_000_000
+
+
 def inpaint_image(
     image: np.ndarray,
     mask: np.ndarray,
@@ -31,32 +86,61 @@ def inpaint_image(
     Returns:
         Inpainted image
     """
-    if method == "telea":
-        inpainted = cv2.inpaint(image, mask, radius, cv2.INPAINT_TELEA)
-    else:
-        inpainted = cv2.inpaint(image, mask, radius, cv2.INPAINT_NS)
+    # Most manga bubbles sit on uniform backgrounds: fill those
+    # components with the median of their boundary pixels (O(|boundary|))
+    # and reserve the diffusion-based inpaint for textured regions
+    result = image.copy()
+    num_labels, labels = cv2.connectedComponents(mask)
+    fallback_mask = np.zeros_like(mask)
+
+    for label in range(1, num_labels):
+        component = (labels == label).astype(np.uint8) * 255
+        boundary = cv2.dilate(component, _BOUNDARY_KERNEL) - component
+        samples = image[boundary.astype(bool)]
+
+        if samples.size and samples.std(axis=0).max() <= _FLAT_STD_THRESHOLD:
+            result[component.astype(bool)] = np.median(samples, axis=0)
+        else:
+            fallback_mask |= component
+
+    if cv2.countNonZero(fallback_mask):
+        flag = cv2.INPAINT_TELEA if method == "telea" else cv2.INPAINT_NS
+
+        if result.shape[0] * result.shape[1] > _DOWNSCALE_THRESHOLD_PX:
+            # Inpaint at half resolution (4x less work), then paste the
+            # upsampled fill back into just the masked pixels; bubble
+            # interiors are smooth so the quality cost is negligible
+            small = cv2.resize(
+                result, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA
+            )
+            small_mask = cv2.resize(
+                fallback_mask, None, fx=0.5, fy=0.5,
+                interpolation=cv2.INTER_NEAREST
+            )
+            small_mask = (small_mask > 0).astype(np.uint8) * 255
+
+            inpainted = cv2.inpaint(
+                small, small_mask, max(1, radius // 2), flag
+            )
+            upsampled = cv2.resize(
+                inpainted, (result.shape[1], result.shape[0]),
+                interpolation=cv2.INTER_LINEAR
+            )
+
+            masked = fallback_mask.astype(bool)
+            result[masked] = upsampled[masked]
+        else:
+            result = cv2.inpaint(result, fallback_mask, radius, flag)
 
-    return inpainted
+    return result
 
 
-async def inpaint_single_panel(
+def _inpaint_panel_sync(
     panel_path: Path,
     boxes_for_panel: List[Dict[str, Any]],
-    output_path: Path,
-    config: Config
+    output_path: Path
 ) -> Path:
-    """
-    Inpaint single panel image.
-
-    Args:
-        panel_path: Path to panel image
-        boxes_for_panel: OCR boxes to inpaint
-        output_path: Output path
-        config: Configuration
-
-    Returns:
-        Output path
-    """
+    """Blocking read→mask→inpaint→write for one panel (runs on a thread)."""
     # Load image
     image = cv2.imread(str(panel_path))
 
@@ -67,17 +151,48 @@ async def inpaint_single_panel(
     # Build mask
     mask = build_mask_for_panel(image.shape, boxes_for_panel, dilation=5)
 
+    # All boxes off-image or zero-area: skip the inpaint and re-encode
+    # entirely (countNonZero is SIMD-accelerated)
+    if cv2.countNonZero(mask) == 0:
+        shutil.copy(panel_path, output_path)
+        logger.debug("Empty mask for %s, copying...", panel_path.name)
+        return output_path
+
     # Inpaint
     inpainted = inpaint_image(image, mask, method="telea", radius=7)
 
     # Save
-    cv2.imwrite(str(output_path), inpainted)
+    _write_png(inpainted, output_path)
 
-    logger.debug(f"Inpainted: {output_path.name}")
+    logger.debug("Inpainted: %s", output_path.name)
 
     return output_path
 
 
+async def inpaint_single_panel(
+    panel_path: Path,
+    boxes_for_panel: List[Dict[str, Any]],
+    output_path: Path,
+    config: Config
+) -> Path:
+    """
+    Inpaint single panel image.
+
+    Args:
+        panel_path: Path to panel image
+        boxes_for_panel: OCR boxes to inpaint
+        output_path: Output path
+        config: Configuration
+
+    Returns:
+        Output path
+    """
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(
+        _INPAINT_POOL, _inpaint_panel_sync, panel_path, boxes_for_panel, output_path
+    )
+
+
 async def inpaint_panels(
     split_paths: List[Path],
     filtered_boxes: List[Dict[str, Any]],
@@ -99,16 +214,15 @@ async def inpaint_panels(
     output_dir = config.workspace_dir / "inpainted"
     output_dir.mkdir(exist_ok=True, parents=True)
 
-    # Group boxes by panel index
-    boxes_by_panel = {}
+    # Group boxes by panel index (one dict lookup per box)
+    boxes_by_panel = defaultdict(list)
     for box in filtered_boxes:
-        panel_idx = box.get('panel_index', 0)
-        if panel_idx not in boxes_by_panel:
-            boxes_by_panel[panel_idx] = []
-        boxes_by_panel[panel_idx].append(box)
+        boxes_by_panel[box.get('panel_index', 0)].append(box)
 
-    # Inpaint each panel
+    # Inpaint panels concurrently on the thread pool; each worker runs
+    # the blocking read→mask→inpaint→write chain for one panel
     inpainted_paths = []
+    tasks = []
 
     for i, panel_path in enumerate(split_paths):
         output_path = output_dir / f"panel_{i:04d}.png"
@@ -116,16 +230,19 @@ async def inpaint_panels(
 
         if not boxes_for_panel:
             # No text to inpaint, just copy
-            import shutil
             shutil.copy(panel_path, output_path)
-            logger.debug(f"No text in panel {i}, copying...")
+            logger.debug("No text in panel %d, copying...", i)
         else:
-            # Inpaint
-            logger.debug(f"Inpainting panel {i} with {len(boxes_for_panel)} text boxes")
-            await inpaint_single_panel(panel_path, boxes_for_panel, output_path, config)
+            logger.debug("Inpainting panel %d with %d text boxes", i, len(boxes_for_panel))
+            tasks.append(
+                inpaint_single_panel(panel_path, boxes_for_panel, output_path, config)
+            )
 
         inpainted_paths.append(output_path)
 
+    if tasks:
+        await asyncio.gather(*tasks)
+
     logger.info(f"Inpainting complete: {len(inpainted_paths)} panels")
 
     return inpainted_paths
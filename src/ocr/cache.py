@@ -0,0 +1,91 @@
+"""Disk cache for OCR results keyed by image content."""
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+import numpy as np
+
+from src.config import Config
+
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate existing caches when OCR behaviour changes
+OCR_CACHE_VERSION = 1
+
+
+def make_key(
+    images: List[Union[Path, np.ndarray]],
+    config: Config
+) -> str:
+    """
+    Build a cache key from image content and OCR settings.
+
+    Hashing is a few milliseconds per chapter, against minutes of OCR
+    on a miss — any change to the pixels or the OCR config produces a
+    different key.
+
+    Args:
+        images: Image paths or in-memory arrays, in panel order
+        config: Configuration (only the ocr section is keyed)
+
+    Returns:
+        Cache key string
+    """
+    content = hashlib.blake2b(digest_size=16)
+    for image in images:
+        if isinstance(image, np.ndarray):
+            content.update(image.tobytes())
+        else:
+            content.update(Path(image).read_bytes())
+
+    settings = hashlib.blake2b(
+        json.dumps(config.ocr.model_dump(), sort_keys=True).encode(),
+        digest_size=16
+    ).hexdigest()
+
+    return f"v{OCR_CACHE_VERSION}-{content.hexdigest()}-{settings}"
+
+
+def _cache_path(key: str, config: Config) -> Path:
+    return config.workspace_dir / ".ocr_cache" / f"{key}.json"
+
+
+def get(key: str, config: Config) -> Optional[List[Dict[str, Any]]]:
+    """
+    Look up cached OCR boxes.
+
+    Args:
+        key: Cache key from make_key
+        config: Configuration
+
+    Returns:
+        Cached box dictionaries, or None on miss or unreadable entry
+    """
+    try:
+        with open(_cache_path(key, config)) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def put(key: str, boxes: List[Dict[str, Any]], config: Config):
+    """
+    Store OCR boxes under a key.
+
+    Cache writes are best-effort: a failure is logged and the pipeline
+    continues with the in-memory result.
+
+    Args:
+        key: Cache key from make_key
+        boxes: OCR box dictionaries to store
+        config: Configuration
+    """
+    cache_path = _cache_path(key, config)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'w') as f:
+            json.dump(boxes, f)
+    except (OSError, TypeError) as e:
+        logger.debug("OCR cache write failed for %s: %s", key, e)
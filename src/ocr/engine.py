@@ -1,7 +1,9 @@
 """OCR engine wrapper for PaddleOCR and EasyOCR."""
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 import asyncio
 import numpy as np
 from PIL import Image
@@ -15,6 +17,15 @@ from src.ocr.postprocess import clean_ocr_text, filter_by_confidence
 logger = logging.getLogger(__name__)
 
 
+# Dedicated OCR pool: the default loop executor is shared with every
+# other blocking call in the process, so OCR work could starve behind
+# unrelated I/O (and vice versa). Model inference is the bottleneck,
+# so a few workers suffice.
+_OCR_POOL = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="ocr"
+)
+
+
 class OCRBox:
     """OCR result box with polygon support."""
 
@@ -42,18 +53,25 @@ class OCRBox:
         self.text = text
         self.confidence = confidence
         self.panel_index = panel_index
-        self._polygon = polygon
+        self._polygon = None
+        self._polygon_np: Optional[np.ndarray] = None
 
         # If polygon provided, compute bounding box from it
         if polygon is not None and len(polygon) >= 4:
-            x_coords = [p[0] for p in polygon]
-            y_coords = [p[1] for p in polygon]
-            self._x = int(min(x_coords))
-            self._y = int(min(y_coords))
-            self._w = int(max(x_coords) - self._x)
-            self._h = int(max(y_coords) - self._y)
+            # Convert once and keep the array; min/max run as C loops
+            # instead of four Python comprehension passes per box.
+            # The list form is materialized lazily on access.
+            pts = np.asarray(polygon, dtype=np.int32)
+            self._polygon_np = pts
+            x_min, y_min = pts.min(axis=0)
+            x_max, y_max = pts.max(axis=0)
+            self._x = int(x_min)
+            self._y = int(y_min)
+            self._w = int(x_max - x_min)
+            self._h = int(y_max - y_min)
         else:
             # Use provided xywh
+            self._polygon = polygon
             self._x = x if x is not None else 0
             self._y = y if y is not None else 0
             self._w = w if w is not None else 0
@@ -81,9 +99,16 @@ class OCRBox:
 
     @property
     def polygon(self) -> Optional[List[List[int]]]:
-        """Get polygon points (if available)."""
+        """Get polygon points as lists (converted lazily, if available)."""
+        if self._polygon is None and self._polygon_np is not None:
+            self._polygon = self._polygon_np.tolist()
         return self._polygon
 
+    @property
+    def polygon_np(self) -> Optional[np.ndarray]:
+        """Get polygon points as an int32 array (if available)."""
+        return self._polygon_np
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         result = {
@@ -95,8 +120,8 @@ class OCRBox:
             "confidence": self.confidence,
             "panel_index": self.panel_index
         }
-        if self._polygon is not None:
-            result["polygon"] = self._polygon
+        if self._polygon_np is not None or self._polygon is not None:
+            result["polygon"] = self.polygon
         return result
 
     @classmethod
@@ -114,6 +139,26 @@ class OCRBox:
         )
 
 
+def _filter_by_confidence(boxes: List[OCRBox], threshold: float) -> List[OCRBox]:
+    """
+    Keep boxes at or above the confidence threshold.
+
+    Confidences gather into one float32 array so the comparison runs as
+    a single vectorized pass instead of a Python-level check per box.
+    """
+    if not boxes:
+        return []
+
+    confidences = np.fromiter(
+        (box.confidence for box in boxes), dtype=np.float32, count=len(boxes)
+    )
+    keep = np.nonzero(confidences >= threshold)[0]
+
+    if len(keep) == len(boxes):
+        return boxes
+    return [boxes[i] for i in keep]
+
+
 class OCREngine:
     """OCR engine with PaddleOCR primary and EasyOCR fallback."""
 
@@ -121,6 +166,29 @@ class OCREngine:
         self.config = config
         self._paddle_ocr = None
         self._easy_ocr = None
+        # Recent PaddleX accepts ndarrays directly; flips off on the
+        # first TypeError from an older path-only build
+        self._paddle_accepts_arrays = True
+        # Reusable temp files for the path-only fallback, created once
+        # and overwritten per call instead of create/unlink churn
+        self._tmp_paths: List[str] = []
+
+    def __del__(self):
+        for tmp_path in self._tmp_paths:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def _tmp_files(self, count: int) -> List[str]:
+        """Return `count` reusable temp PNG paths, growing the pool."""
+        import tempfile
+
+        while len(self._tmp_paths) < count:
+            fd, tmp_path = tempfile.mkstemp(suffix='.png')
+            os.close(fd)
+            self._tmp_paths.append(tmp_path)
+        return self._tmp_paths[:count]
 
     def _init_paddle_ocr(self):
         """Initialize PaddleX OCR pipeline."""
@@ -166,66 +234,121 @@ class OCREngine:
             # Preprocess image
             preprocessed = preprocess_for_ocr(image)
 
-            # Save to temp file (PaddleX requires file path)
-            import tempfile
-            import os
-            from PIL import Image as PILImage
+            # Run OCR with PaddleX (in memory; no temp-file round-trip)
+            output = self._paddle_predict([preprocessed])
 
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
-                PILImage.fromarray(preprocessed).save(tmp_path)
+            if not output:
+                logger.warning("PaddleX OCR returned no results")
+                return []
 
-            try:
-                # Run OCR with PaddleX
-                output = self._paddle_ocr.predict(
-                    input=tmp_path,
-                    use_doc_orientation_classify=False,
-                    use_doc_unwarping=False,
-                    use_textline_orientation=False
-                )
-
-                if not output:
-                    logger.warning("PaddleX OCR returned no results")
-                    return []
-
-                # Parse PaddleX result format (based on official docs)
-                # Temp file must exist during iteration as predict() returns lazy generator
-                boxes = []
-                for result in output:
-                    # According to docs: dt_polys, rec_texts, rec_scores
-                    if hasattr(result, 'dt_polys') and hasattr(result, 'rec_texts') and hasattr(result, 'rec_scores'):
-                        # Iterate through detected text regions
-                        for bbox, text, score in zip(result.dt_polys, result.rec_texts, result.rec_scores):
-                            # bbox is numpy array of shape (4, 2) with dtype int16
-                            # Convert to list of [x, y] points
-                            polygon = [[int(p[0]), int(p[1])] for p in bbox]
-
-                            confidence = float(score)
-
-                            # Clean text
-                            text = clean_ocr_text(text)
-
-                            if text:
-                                # Create OCRBox with polygon (xywh computed automatically)
-                                boxes.append(OCRBox(
-                                    text=text,
-                                    confidence=confidence,
-                                    polygon=polygon
-                                ))
-
-                logger.info(f"PaddleX OCR detected {len(boxes)} text boxes")
-                return boxes
-
-            finally:
-                # Clean up temp file AFTER consuming all results from generator
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
+            # Parse PaddleX result format (based on official docs)
+            boxes = []
+            for result in output:
+                boxes.extend(self._parse_paddle_result(result))
+
+            logger.info(f"PaddleX OCR detected {len(boxes)} text boxes")
+            return boxes
 
         except Exception as e:
             logger.error(f"PaddleX OCR failed: {e}")
             logger.exception(e)  # Log full traceback for debugging
             return []
 
+    def _paddle_predict(self, inputs: List[np.ndarray]) -> list:
+        """
+        Run PaddleX predict over preprocessed arrays.
+
+        Arrays go straight to predict, skipping the PNG encode/decode
+        round-trip through a temp file; builds that only accept paths
+        fall back to temp files on the first TypeError.
+        """
+        kwargs = dict(
+            use_doc_orientation_classify=False,
+            use_doc_unwarping=False,
+            use_textline_orientation=False
+        )
+
+        if self._paddle_accepts_arrays:
+            try:
+                return list(self._paddle_ocr.predict(input=inputs, **kwargs))
+            except TypeError:
+                logger.info("PaddleX predict rejected ndarray input; using temp files")
+                self._paddle_accepts_arrays = False
+
+        # Overwrite the pooled temp files; uncompressed PNG skips the
+        # DEFLATE pass since the files live only for this predict call
+        tmp_paths = self._tmp_files(len(inputs))
+        for tmp_path, image in zip(tmp_paths, inputs):
+            cv2.imwrite(tmp_path, image, [cv2.IMWRITE_PNG_COMPRESSION, 0])
+
+        # Consume the lazy generator while the temp files still exist
+        return list(self._paddle_ocr.predict(input=tmp_paths, **kwargs))
+
+    @staticmethod
+    def _parse_paddle_result(result) -> List[OCRBox]:
+        """Parse one PaddleX prediction result into OCR boxes."""
+        boxes = []
+
+        # According to docs: dt_polys, rec_texts, rec_scores
+        if hasattr(result, 'dt_polys') and hasattr(result, 'rec_texts') and hasattr(result, 'rec_scores'):
+            # Iterate through detected text regions
+            for bbox, text, score in zip(result.dt_polys, result.rec_texts, result.rec_scores):
+                # bbox is numpy array of shape (4, 2) with dtype int16;
+                # one C-level conversion instead of per-vertex int() calls
+                polygon = np.asarray(bbox, dtype=np.int32)
+
+                confidence = float(score)
+
+                # Clean text
+                text = clean_ocr_text(text)
+
+                if text:
+                    # Create OCRBox with polygon (xywh computed automatically)
+                    boxes.append(OCRBox(
+                        text=text,
+                        confidence=confidence,
+                        polygon=polygon
+                    ))
+
+        return boxes
+
+    def run_paddle_ocr_batch(self, images: List[np.ndarray]) -> List[List[OCRBox]]:
+        """
+        Run PaddleX OCR over several panels in one predict call.
+
+        Batching lets PaddleX amortize preprocessing and model launch
+        overhead across panels instead of paying it once per file.
+
+        Args:
+            images: Panel images as numpy arrays
+
+        Returns:
+            One list of OCR boxes per input image, in order
+        """
+        self._init_paddle_ocr()
+
+        try:
+            preprocessed = [preprocess_for_ocr(image) for image in images]
+
+            # One predict over the whole list; results come back in
+            # input order, one per panel
+            output = self._paddle_predict(preprocessed)
+
+            per_panel = [self._parse_paddle_result(r) for r in output]
+
+            # Pad if PaddleX dropped trailing results
+            while len(per_panel) < len(images):
+                per_panel.append([])
+
+            total = sum(len(b) for b in per_panel)
+            logger.info(f"PaddleX OCR detected {total} text boxes across {len(images)} panels")
+            return per_panel
+
+        except Exception as e:
+            logger.error(f"PaddleX batch OCR failed: {e}")
+            logger.exception(e)
+            return [[] for _ in images]
+
     def run_easy_ocr(self, image: np.ndarray) -> List[OCRBox]:
         """
         Run EasyOCR on image (fallback).
@@ -251,8 +374,8 @@ class OCREngine:
                 text = detection[1]
                 confidence = float(detection[2])
 
-                # Convert to list of [x, y] points (polygon)
-                polygon = [[int(p[0]), int(p[1])] for p in bbox]
+                # One C-level conversion instead of per-vertex int() calls
+                polygon = np.asarray(bbox, dtype=np.int32)
 
                 text = clean_ocr_text(text)
 
@@ -271,18 +394,22 @@ class OCREngine:
             logger.error(f"EasyOCR failed: {e}")
             return []
 
-    def run(self, image_path: Path) -> List[OCRBox]:
+    def run(self, image_path: "Union[Path, np.ndarray]") -> List[OCRBox]:
         """
-        Run OCR on image file.
+        Run OCR on an image file or an in-memory image.
 
         Args:
-            image_path: Path to image
+            image_path: Path to image, or an RGB array (as the stitcher
+                hands over when artifacts are kept in memory)
 
         Returns:
             List of OCR boxes
         """
-        # Load image
-        image = cv2.imread(str(image_path))
+        # Load image (arrays arrive RGB; cv2 works in BGR)
+        if isinstance(image_path, np.ndarray):
+            image = cv2.cvtColor(image_path, cv2.COLOR_RGB2BGR)
+        else:
+            image = cv2.imread(str(image_path))
 
         if image is None:
             logger.error(f"Failed to load image: {image_path}")
@@ -306,30 +433,100 @@ class OCREngine:
                 boxes = self.run_paddle_ocr(image)
 
         # Filter by confidence
-        boxes = [
-            box for box in boxes
-            if box.confidence >= self.config.ocr.confidence_threshold
+        return _filter_by_confidence(boxes, self.config.ocr.confidence_threshold)
+
+    def run_batch(self, image_paths: List[Path]) -> List[List[OCRBox]]:
+        """
+        Run OCR on multiple image files, batching where the engine allows.
+
+        Args:
+            image_paths: Paths to panel images
+
+        Returns:
+            One list of OCR boxes per input path, in order
+        """
+        images = [cv2.imread(str(path)) for path in image_paths]
+        for path, image in zip(image_paths, images):
+            if image is None:
+                logger.error(f"Failed to load image: {path}")
+
+        if self.config.ocr.primary_engine == "paddleocr":
+            # One batched predict over every loadable panel
+            loadable = [i for i, img in enumerate(images) if img is not None]
+            batched = self.run_paddle_ocr_batch([images[i] for i in loadable])
+
+            per_panel: List[List[OCRBox]] = [[] for _ in images]
+            for idx, boxes in zip(loadable, batched):
+                per_panel[idx] = boxes
+
+            # Fallback to EasyOCR per empty panel
+            if self.config.ocr.fallback_engine == "easyocr":
+                for idx in loadable:
+                    if not per_panel[idx]:
+                        logger.info("Falling back to EasyOCR...")
+                        per_panel[idx] = self.run_easy_ocr(images[idx])
+        else:
+            # EasyOCR has no batch API; keep the per-panel path
+            per_panel = [
+                self.run(path) for path in image_paths
+            ]
+            return per_panel
+
+        # Filter by confidence
+        threshold = self.config.ocr.confidence_threshold
+        return [
+            _filter_by_confidence(boxes, threshold)
+            for boxes in per_panel
         ]
 
-        return boxes
 
+# Engine cached across calls: the lazy model init inside OCREngine
+# loads weights once per instance, so rebuilding one per call would
+# re-pay seconds of startup for every panel batch
+_engine: Optional[OCREngine] = None
+_engine_key: Optional[tuple] = None
 
-async def run_ocr(image_path: Path, config: Config) -> List[Dict[str, Any]]:
+
+def _get_engine(config: Config) -> OCREngine:
+    """Return the shared OCREngine, rebuilt only when engine selection changes."""
+    global _engine, _engine_key
+
+    key = (
+        config.ocr.primary_engine,
+        config.ocr.fallback_engine,
+        tuple(config.ocr.languages),
+    )
+
+    if _engine is None or _engine_key != key:
+        _engine = OCREngine(config)
+        _engine_key = key
+    else:
+        # Keep tunables like confidence_threshold current without
+        # discarding the loaded models
+        _engine.config = config
+
+    return _engine
+
+
+async def run_ocr(
+    image_path: "Union[Path, np.ndarray]",
+    config: Config
+) -> List[Dict[str, Any]]:
     """
     Run OCR on single image (async wrapper).
 
     Args:
-        image_path: Path to image
+        image_path: Path to image, or an in-memory RGB array
         config: Configuration
 
     Returns:
         List of OCR box dictionaries
     """
-    engine = OCREngine(config)
+    engine = _get_engine(config)
 
     # Run in thread pool to avoid blocking
     loop = asyncio.get_event_loop()
-    boxes = await loop.run_in_executor(None, engine.run, image_path)
+    boxes = await loop.run_in_executor(_OCR_POOL, engine.run, image_path)
 
     return [box.to_dict() for box in boxes]
 
@@ -345,17 +542,17 @@ async def run_ocr_batch(image_paths: List[Path], config: Config) -> List[Dict[st
     Returns:
         List of all OCR boxes with panel_index set
     """
-    engine = OCREngine(config)
-    all_boxes = []
+    engine = _get_engine(config)
 
-    for panel_index, image_path in enumerate(image_paths):
-        logger.info(f"Running OCR on panel {panel_index + 1}/{len(image_paths)}")
+    logger.info(f"Running OCR on {len(image_paths)} panels...")
 
-        # Run OCR
-        loop = asyncio.get_event_loop()
-        boxes = await loop.run_in_executor(None, engine.run, image_path)
+    # One executor hop for the whole batch instead of one per panel
+    loop = asyncio.get_event_loop()
+    per_panel = await loop.run_in_executor(_OCR_POOL, engine.run_batch, image_paths)
 
-        # Set panel index
+    # Set panel index
+    all_boxes = []
+    for panel_index, boxes in enumerate(per_panel):
         for box in boxes:
             box.panel_index = panel_index
             all_boxes.append(box.to_dict())
@@ -1,14 +1,24 @@
 """OCR result post-processing."""
 import logging
 import re
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+# Compiled once: clean_ocr_text runs per box, thousands of times per
+# chapter, so per-call pattern lookups and the split/join temp list
+# are pure overhead
+_ARTIFACT_RE = re.compile(r'[|~`]')
+_WS_RE = re.compile(r'\s+')
+
+
 def clean_ocr_text(text: str) -> str:
     """
     Clean OCR output text.
 
+    Strips common OCR artifacts and collapses whitespace runs.
+
     Args:
         text: Raw OCR text
 
@@ -18,16 +28,15 @@ def clean_ocr_text(text: str) -> str:
     if not text:
         return ""
 
-    # Remove extra whitespace
-    cleaned = " ".join(text.split())
-
-    # Remove common OCR artifacts
-    cleaned = re.sub(r'[|~`]', '', cleaned)
-
     # Fix common Korean OCR errors (if needed)
     # Add specific fixes here
 
-    return cleaned.strip()
+    return _WS_RE.sub(' ', _ARTIFACT_RE.sub('', text)).strip()
+
+
+# Pre-LLM confidence floor: boxes below this are almost always OCR
+# noise, and dropping them up front saves filter/translate tokens
+FILTER_CONF_DEFAULT = 0.8
 
 
 def filter_by_confidence(ocr_boxes: list, threshold: float) -> list:
@@ -41,10 +50,20 @@ def filter_by_confidence(ocr_boxes: list, threshold: float) -> list:
     Returns:
         Filtered list of OCR boxes
     """
-    filtered = [
-        box for box in ocr_boxes
-        if box.get("confidence", 0) >= threshold
-    ]
+    if not ocr_boxes:
+        return []
+
+    # One vectorized comparison instead of a per-box Python check
+    confidences = np.fromiter(
+        (box.get("confidence", 0) for box in ocr_boxes),
+        dtype=np.float32, count=len(ocr_boxes)
+    )
+    keep = np.flatnonzero(confidences >= threshold)
+
+    if len(keep) == len(ocr_boxes):
+        filtered = ocr_boxes
+    else:
+        filtered = [ocr_boxes[i] for i in keep]
 
     logger.info(f"Filtered {len(ocr_boxes)} -> {len(filtered)} boxes (threshold={threshold})")
 
@@ -67,27 +86,48 @@ def merge_nearby_boxes(ocr_boxes: list, max_distance: int = 10) -> list:
 
     # Sort by y-coordinate
     sorted_boxes = sorted(ocr_boxes, key=lambda b: b["y"])
+    n = len(sorted_boxes)
+
+    # Structure-of-arrays: pull the coordinates into four contiguous
+    # int32 arrays once, so grouping and bbox reduction run as vector
+    # ops instead of per-box dict lookups in a Python loop
+    xs = np.fromiter((b["x"] for b in sorted_boxes), dtype=np.int32, count=n)
+    ys = np.fromiter((b["y"] for b in sorted_boxes), dtype=np.int32, count=n)
+    ws = np.fromiter((b["w"] for b in sorted_boxes), dtype=np.int32, count=n)
+    hs = np.fromiter((b["h"] for b in sorted_boxes), dtype=np.int32, count=n)
+
+    # Vertical gap between each box and its predecessor; a gap above
+    # max_distance starts a new group, so cumsum yields group ids
+    gaps = np.abs(ys[1:] - (ys[:-1] + hs[:-1]))
+    group_ids = np.concatenate(([0], np.cumsum(gaps > max_distance)))
+    starts = np.unique(group_ids, return_index=True)[1]
+    ends = np.append(starts[1:], n)
+
+    # Per-group bounding boxes in four segmented reductions
+    min_x = np.minimum.reduceat(xs, starts)
+    min_y = np.minimum.reduceat(ys, starts)
+    max_x = np.maximum.reduceat(xs + ws, starts)
+    max_y = np.maximum.reduceat(ys + hs, starts)
 
     merged = []
-    current_group = [sorted_boxes[0]]
-
-    for box in sorted_boxes[1:]:
-        prev_box = current_group[-1]
-
-        # Check if boxes are close vertically
-        vertical_distance = abs(box["y"] - (prev_box["y"] + prev_box["h"]))
-
-        if vertical_distance <= max_distance:
-            # Add to current group
-            current_group.append(box)
-        else:
-            # Merge current group and start new one
-            merged.append(merge_box_group(current_group))
-            current_group = [box]
-
-    # Merge last group
-    if current_group:
-        merged.append(merge_box_group(current_group))
+    for g in range(len(starts)):
+        start, end = starts[g], ends[g]
+        if end - start == 1:
+            merged.append(sorted_boxes[start])
+            continue
+
+        group = sorted_boxes[start:end]
+        x0, y0 = int(min_x[g]), int(min_y[g])
+        x1, y1 = int(max_x[g]), int(max_y[g])
+        merged.append({
+            "x": x0,
+            "y": y0,
+            "w": x1 - x0,
+            "h": y1 - y0,
+            "text": " ".join(b["text"] for b in group),
+            "confidence": sum(b.get("confidence", 0) for b in group) / len(group),
+            "polygon": [[x0, y0], [x1, y0], [x1, y1], [x0, y1]]
+        })
 
     logger.info(f"Merged {len(ocr_boxes)} -> {len(merged)} boxes")
 
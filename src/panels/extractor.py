@@ -5,7 +5,6 @@ from pathlib import Path
 from typing import List
 import aiohttp
 from PIL import Image
-from io import BytesIO
 
 from src.config import Config
 
@@ -30,22 +29,23 @@ async def download_image(session: aiohttp.ClientSession, url: str, output_path:
         try:
             async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
                 if response.status == 200:
-                    content = await response.read()
+                    # Stream straight to disk in 64 KB chunks: no full
+                    # body buffered in memory, no second copy on write
+                    with open(output_path, 'wb') as f:
+                        async for chunk in response.content.iter_chunked(1 << 16):
+                            f.write(chunk)
 
-                    # Validate image
+                    # Validate image from disk
                     try:
-                        img = Image.open(BytesIO(content))
-                        img.verify()
-
-                        # Save image
-                        with open(output_path, 'wb') as f:
-                            f.write(content)
+                        with Image.open(output_path) as img:
+                            img.verify()
 
                         logger.debug(f"Downloaded: {output_path.name}")
                         return True
 
                     except Exception as e:
                         logger.warning(f"Invalid image from {url}: {e}")
+                        output_path.unlink(missing_ok=True)
                         return False
 
                 else:
@@ -81,8 +81,28 @@ async def extract_panels(panel_urls: List[str], config: Config) -> List[Path]:
 
     logger.info(f"Downloading {len(panel_urls)} panels...")
 
+    # Pooled keep-alive connections: panels all come from one CDN, so
+    # without a configured connector every request may pay a fresh
+    # TCP+TLS handshake. Images are pre-compressed, so opt out of
+    # transfer encoding too.
+    connector = aiohttp.TCPConnector(
+        limit=config.download.max_concurrency,
+        limit_per_host=16,
+        ttl_dns_cache=300,
+        keepalive_timeout=30
+    )
+    # Bound in-flight downloads rather than launching one coroutine per
+    # panel against the same host
+    semaphore = asyncio.Semaphore(config.download.max_concurrency)
+
+    async def download_bounded(session, url, output_path):
+        async with semaphore:
+            return await download_image(session, url, output_path)
+
     # Create tasks for parallel download
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(
+        connector=connector, headers={'Accept-Encoding': 'identity'}
+    ) as session:
         tasks = []
 
         for i, url in enumerate(panel_urls):
@@ -90,7 +110,7 @@ async def extract_panels(panel_urls: List[str], config: Config) -> List[Path]:
             ext = ".png" if url.lower().endswith(".png") else ".jpg"
             output_path = output_dir / f"panel_{i:04d}{ext}"
 
-            task = download_image(session, url, output_path)
+            task = download_bounded(session, url, output_path)
             tasks.append((output_path, task))
 
         # Wait for all downloads
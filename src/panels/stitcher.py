@@ -1,7 +1,9 @@
 """Vertical panel stitcher."""
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Tuple, Union
 import numpy as np
 from PIL import Image
 
@@ -11,7 +13,10 @@ from src.config import Config
 logger = logging.getLogger(__name__)
 
 
-async def stitch_panels(panel_paths: List[Path], config: Config) -> Tuple[Path, List[Tuple[int, int, int]]]:
+async def stitch_panels(
+    panel_paths: List[Path],
+    config: Config
+) -> Tuple[Union[Path, np.ndarray], List[Tuple[int, int, int]]]:
     """
     Stitch panels vertically into single image.
 
@@ -20,7 +25,10 @@ async def stitch_panels(panel_paths: List[Path], config: Config) -> Tuple[Path,
         config: Configuration
 
     Returns:
-        Tuple of (stitched_image_path, coordinate_mapping)
+        Tuple of (stitched_image, coordinate_mapping)
+        stitched_image: Path to the saved PNG, or the RGB canvas array
+        directly when debug.save_artifacts is off (downstream OCR and
+        split accept both, skipping the PNG encode/decode round trip)
         coordinate_mapping: List of (y_start, y_end, panel_index)
     """
     if not panel_paths:
@@ -28,15 +36,25 @@ async def stitch_panels(panel_paths: List[Path], config: Config) -> Tuple[Path,
 
     logger.info(f"Stitching {len(panel_paths)} panels...")
 
-    # Load all panels
+    # Decode all panels on a thread pool: libpng/libjpeg release the
+    # GIL, so the decodes run truly in parallel instead of serially
+    # idling the other cores
+    def _load(path: Path) -> Image.Image:
+        return Image.open(path).convert("RGB")
+
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=min(8, len(panel_paths))) as pool:
+        results = await asyncio.gather(
+            *(loop.run_in_executor(pool, _load, path) for path in panel_paths),
+            return_exceptions=True
+        )
+
     panels = []
-    for path in panel_paths:
-        try:
-            img = Image.open(path)
-            panels.append(img.convert("RGB"))
-        except Exception as e:
-            logger.error(f"Failed to load panel {path}: {e}")
+    for path, result in zip(panel_paths, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to load panel {path}: {result}")
             continue
+        panels.append(result)
 
     if not panels:
         raise ValueError("No valid panels loaded")
@@ -49,8 +67,9 @@ async def stitch_panels(panel_paths: List[Path], config: Config) -> Tuple[Path,
     total_height = sum(img.height for img in panels)
     logger.info(f"Total stitched height: {total_height}px")
 
-    # Create blank canvas
-    stitched = Image.new("RGB", (max_width, total_height), color=(255, 255, 255))
+    # Blank white canvas as one preallocated ndarray; each panel blits
+    # in with a slice assignment (a memcpy) instead of a PIL paste call
+    canvas = np.full((total_height, max_width, 3), 255, dtype=np.uint8)
 
     # Stitch panels with coordinate mapping
     coord_map = []
@@ -60,8 +79,10 @@ async def stitch_panels(panel_paths: List[Path], config: Config) -> Tuple[Path,
         # Center-align panel
         x_offset = (max_width - panel.width) // 2
 
-        # Paste panel
-        stitched.paste(panel, (x_offset, current_y))
+        # Blit panel
+        arr = np.asarray(panel)
+        canvas[current_y:current_y + panel.height,
+               x_offset:x_offset + panel.width] = arr
 
         # Record coordinates
         y_start = current_y
@@ -70,20 +91,26 @@ async def stitch_panels(panel_paths: List[Path], config: Config) -> Tuple[Path,
 
         current_y = y_end
 
-    # Save stitched image
+    # Without artifacts, hand the canvas straight to the next stage:
+    # the PNG here exists only to be decoded right back by OCR/split
+    if not config.debug.save_artifacts:
+        logger.info("Keeping stitched image in memory (save_artifacts off)")
+        return canvas, coord_map
+
+    # Save stitched image. Low zlib level: this is a scratch artifact
+    # consumed once by OCR, so write speed beats file size.
     output_dir = config.workspace_dir / "stitched"
     output_dir.mkdir(exist_ok=True, parents=True)
     output_path = output_dir / "full_chapter.png"
 
-    stitched.save(output_path, "PNG")
+    Image.fromarray(canvas).save(output_path, "PNG", compress_level=1)
     logger.info(f"Stitched image saved: {output_path}")
 
     # Log coordinate mapping
-    if config.debug.save_artifacts:
-        map_file = output_dir / "coordinate_map.txt"
-        with open(map_file, 'w') as f:
-            f.write("y_start,y_end,panel_index\n")
-            for y_start, y_end, panel_idx in coord_map:
-                f.write(f"{y_start},{y_end},{panel_idx}\n")
+    map_file = output_dir / "coordinate_map.txt"
+    with open(map_file, 'w') as f:
+        f.write("y_start,y_end,panel_index\n")
+        for y_start, y_end, panel_idx in coord_map:
+            f.write(f"{y_start},{y_end},{panel_idx}\n")
 
     return output_path, coord_map
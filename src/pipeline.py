@@ -1,6 +1,9 @@
 """Main pipeline orchestration."""
 import asyncio
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional, Callable, Dict, Any
 from enum import Enum
@@ -8,6 +11,45 @@ from enum import Enum
 from src.config import Config, get_config
 
 
+# Background logging: worker threads enqueue records (nanoseconds, no
+# lock contention) and one listener thread does the formatting and I/O
+_log_listener: Optional[QueueListener] = None
+
+
+def _setup_logging(level: int):
+    """
+    Configure root logging through a queue.
+
+    Mirrors basicConfig semantics (no-op when handlers already exist)
+    but puts the console handler behind a QueueListener so hot OCR and
+    inpaint threads never block on formatting or terminal writes.
+    """
+    global _log_listener
+
+    root = logging.getLogger()
+
+    if _log_listener is not None:
+        root.setLevel(level)
+        return
+
+    if root.handlers:
+        # Host app (e.g. Streamlit) already configured logging
+        return
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    ))
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+    _log_listener = QueueListener(log_queue, console_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+
 class PipelineStage(Enum):
     """Pipeline execution stages."""
     INIT = "init"
@@ -62,9 +104,8 @@ class Pipeline:
         self.progress_callback: Optional[Callable[[PipelineState], None]] = None
 
         # Setup logging
-        logging.basicConfig(
-            level=logging.DEBUG if self.config.debug.debug_mode else logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        _setup_logging(
+            logging.DEBUG if self.config.debug.debug_mode else logging.INFO
         )
         self.logger = logging.getLogger(__name__)
 
@@ -220,9 +261,19 @@ class Pipeline:
         return await stitch_panels(panel_paths, self.config)
 
     async def _run_ocr_pass1(self, stitched_path: Path):
-        """Run OCR on stitched image."""
+        """Run OCR on stitched image (cached by image content)."""
+        from src.ocr import cache as ocr_cache
         from src.ocr.engine import run_ocr
-        return await run_ocr(stitched_path, self.config)
+
+        key = ocr_cache.make_key([stitched_path], self.config)
+        cached = ocr_cache.get(key, self.config)
+        if cached is not None:
+            self.logger.info(f"OCR pass 1 cache hit ({len(cached)} boxes)")
+            return cached
+
+        boxes = await run_ocr(stitched_path, self.config)
+        ocr_cache.put(key, boxes, self.config)
+        return boxes
 
     async def _smart_split(self, stitched_path: Path, ocr_boxes: list):
         """Smart split stitched image."""
@@ -230,13 +281,28 @@ class Pipeline:
         return await smart_split(stitched_path, ocr_boxes, self.config)
 
     async def _run_ocr_pass2(self, split_paths: list[Path]):
-        """Run OCR on split panels."""
+        """Run OCR on split panels (cached by panel content)."""
+        from src.ocr import cache as ocr_cache
         from src.ocr.engine import run_ocr_batch
-        return await run_ocr_batch(split_paths, self.config)
+
+        key = ocr_cache.make_key(split_paths, self.config)
+        cached = ocr_cache.get(key, self.config)
+        if cached is not None:
+            self.logger.info(f"OCR pass 2 cache hit ({len(cached)} boxes)")
+            return cached
+
+        boxes = await run_ocr_batch(split_paths, self.config)
+        ocr_cache.put(key, boxes, self.config)
+        return boxes
 
     async def _filter_text(self, ocr_boxes: list):
-        """Filter text with LLM."""
+        """Filter text with LLM (after a cheap confidence pre-filter)."""
         from src.agents.filter_agent import filter_text_boxes
+        from src.ocr.postprocess import FILTER_CONF_DEFAULT, filter_by_confidence
+
+        # Drop low-confidence noise before spending LLM tokens on it;
+        # filter_by_confidence logs how many boxes were removed
+        ocr_boxes = filter_by_confidence(ocr_boxes, FILTER_CONF_DEFAULT)
         return await filter_text_boxes(ocr_boxes, self.config)
 
     async def _translate_text(self, filtered_boxes: list):
@@ -1,6 +1,9 @@
 """Compose final translated images."""
 import asyncio
 import logging
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 import cv2
@@ -12,6 +15,20 @@ from src.config import Config
 logger = logging.getLogger(__name__)
 
 
+def _link_or_copy(src: Path, dst: Path):
+    """
+    Materialize src at dst cheaply.
+
+    A hardlink is a metadata-only op (no bytes move); fall back to
+    copyfile — which uses sendfile on Linux — across filesystems.
+    """
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
 async def compose_final_images(
     rendered_paths: List[Path],
     config: Config
@@ -34,16 +51,18 @@ async def compose_final_images(
     output_dir = config.workspace_dir / "final"
     output_dir.mkdir(exist_ok=True, parents=True)
 
-    final_paths = []
-
-    # Copy rendered panels to final directory
-    import shutil
-
-    for i, rendered_path in enumerate(rendered_paths):
+    # Hardlink (or copy) rendered panels into the final directory, in
+    # parallel: the calls are metadata/IO-bound and GIL-free, and
+    # executor.map preserves input order
+    def _finalize_one(item) -> Path:
+        i, rendered_path = item
         output_path = output_dir / f"page_{i:04d}.png"
-        shutil.copy(rendered_path, output_path)
-        final_paths.append(output_path)
-        logger.debug(f"Finalized: {output_path.name}")
+        _link_or_copy(rendered_path, output_path)
+        logger.debug("Finalized: %s", output_path.name)
+        return output_path
+
+    with ThreadPoolExecutor(max_workers=min(8, len(rendered_paths) or 1)) as pool:
+        final_paths = list(pool.map(_finalize_one, enumerate(rendered_paths)))
 
     logger.info(f"Composition complete: {len(final_paths)} final images")
 
@@ -98,9 +117,11 @@ async def reassemble_full_chapter(
         full_image.paste(panel, (x_offset, current_y))
         current_y += panel.height
 
-    # Save
+    # Save. Low zlib level: the default level 6 single-threaded DEFLATE
+    # dominates the write for a chapter-height canvas, and the pages
+    # were already hardlinked out at full quality.
     output_path = config.workspace_dir / "final" / output_name
-    full_image.save(output_path, "PNG")
+    full_image.save(output_path, "PNG", compress_level=1)
 
     logger.info(f"Full chapter saved: {output_path}")
 
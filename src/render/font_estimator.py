@@ -1,5 +1,6 @@
 """Estimate font properties from original text box."""
 import logging
+import textwrap
 from typing import Dict, Tuple
 
 logger = logging.getLogger(__name__)
@@ -18,10 +19,9 @@ def estimate_font_size(box_height: int, size_multiplier: float = 0.8) -> int:
     """
     font_size = int(box_height * size_multiplier)
 
-    # Clamp to reasonable range
-    font_size = max(12, min(font_size, 100))
-
-    return font_size
+    # Clamp to reasonable range (inline conditionals skip two function
+    # calls on a path that runs once per rendered box)
+    return 12 if font_size < 12 else 100 if font_size > 100 else font_size
 
 
 def estimate_font_properties(box: Dict) -> Dict[str, any]:
@@ -82,23 +82,9 @@ def calculate_text_dimensions(
     avg_char_width = font_size * 0.6
     chars_per_line = max(1, int(max_width / avg_char_width))
 
-    # Estimate number of lines needed
-    words = text.split()
-    lines = []
-    current_line = ""
-
-    for word in words:
-        if len(current_line) + len(word) + 1 <= chars_per_line:
-            current_line += word + " "
-        else:
-            if current_line:
-                lines.append(current_line.strip())
-            current_line = word + " "
-
-    if current_line:
-        lines.append(current_line.strip())
-
-    num_lines = len(lines) if lines else 1
+    # textwrap does the greedy word wrap in optimized stdlib code
+    # instead of a per-word Python loop with string concatenation
+    num_lines = len(textwrap.wrap(text, width=chars_per_line) or [''])
 
     # Calculate dimensions
     height = num_lines * int(font_size * 1.2)  # Line height = font_size * 1.2
@@ -1,7 +1,7 @@
 """Smart split algorithm to avoid cutting through text."""
 import logging
 from pathlib import Path
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Union
 import numpy as np
 from PIL import Image
 import cv2
@@ -127,7 +127,7 @@ def select_balanced_cuts(safe_cuts: List[int], max_subpanels: int) -> List[int]:
 
 
 async def smart_split(
-    stitched_path: Path,
+    stitched_path: "Union[Path, np.ndarray]",
     ocr_boxes: List[Dict[str, Any]],
     config: Config
 ) -> List[Path]:
@@ -135,7 +135,8 @@ async def smart_split(
     Smart split stitched image at safe cut lines.
 
     Args:
-        stitched_path: Path to stitched image
+        stitched_path: Path to stitched image, or the in-memory RGB
+            canvas from the stitcher when artifacts are not saved
         ocr_boxes: OCR boxes from pass 1
         config: Configuration
 
@@ -144,9 +145,13 @@ async def smart_split(
     """
     logger.info("Running smart split algorithm...")
 
-    # Load stitched image
-    image = Image.open(stitched_path)
-    img_array = np.array(image)
+    # Load stitched image (or wrap the canvas the stitcher kept in RAM)
+    if isinstance(stitched_path, np.ndarray):
+        img_array = stitched_path
+        image = Image.fromarray(img_array)
+    else:
+        image = Image.open(stitched_path)
+        img_array = np.array(image)
     height = img_array.shape[0]
 
     logger.info(f"Image dimensions: {image.width}x{height}")
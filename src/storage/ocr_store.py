@@ -5,6 +5,11 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+try:
+    import pandas as pd
+except ImportError:  # optional C-accelerated CSV parser
+    pd = None
+
 from src.config import Config
 
 
@@ -73,6 +78,13 @@ class OCRStore:
             logger.warning(f"OCR store not found: {self.csv_path}")
             return []
 
+        # Prefer pandas: C-level parsing and typed columns beat a
+        # per-row DictReader with five Python conversions per box
+        if pd is not None:
+            boxes = self._load_boxes_pandas(image_id)
+            logger.info(f"Loaded {len(boxes)} OCR boxes from {self.csv_path}")
+            return boxes
+
         boxes = []
 
         with open(self.csv_path, 'r', encoding='utf-8') as f:
@@ -107,6 +119,35 @@ class OCRStore:
         logger.info(f"Loaded {len(boxes)} OCR boxes from {self.csv_path}")
         return boxes
 
+    def _load_boxes_pandas(self, image_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Vectorized CSV load used when pandas is available."""
+        df = pd.read_csv(
+            self.csv_path,
+            dtype={
+                'image_id': str, 'box_id': 'int64',
+                'x': 'int64', 'y': 'int64', 'w': 'int64', 'h': 'int64',
+                'text': str, 'confidence': 'float64',
+                'panel_index': 'int64', 'polygon': str
+            },
+            keep_default_na=False
+        )
+
+        if image_id:
+            df = df[df['image_id'] == image_id]
+
+        boxes = df.to_dict('records')
+
+        for box in boxes:
+            polygon_str = box.pop('polygon', "")
+            if polygon_str:
+                try:
+                    box['polygon'] = json.loads(polygon_str)
+                except (json.JSONDecodeError, ValueError):
+                    # If polygon parsing fails, ignore it (backward compatibility)
+                    pass
+
+        return boxes
+
     def query_by_panel(self, panel_index: int) -> List[Dict[str, Any]]:
         """
         Query boxes by panel index.